@@ -0,0 +1,193 @@
+"""공과금 세대별 배분 계산 (Flask/DB 비의존)
+
+입력은 세대별 검침값·거주 인원·할인 대상 여부 같은 평범한 값들의 시퀀스이고,
+출력은 상세 테이블에 그대로 저장할 수 있는 dict 레코드 목록이다.
+비례 배분은 Fraction 으로 먼저 곱하고 나중에 나누어 오차 없이 계산하고,
+청구액은 정확한 10원 단위 올림으로 확정한다. 레코드의 금액은 Decimal 이다.
+"""
+from decimal import Decimal
+from fractions import Fraction
+
+ZERO = Decimal('0')
+
+
+def to_decimal(val):
+    if isinstance(val, Decimal):
+        return val
+    if val is None or val == '':
+        return ZERO
+    return Decimal(str(val))
+
+
+def _exact(val):
+    """입력값 → Fraction (Decimal/int 는 오차 없이 변환)"""
+    if isinstance(val, Fraction):
+        return val
+    return Fraction(to_decimal(val))
+
+
+def _record(val):
+    """Fraction → 레코드용 Decimal"""
+    return Decimal(val.numerator) / Decimal(val.denominator)
+
+
+def round_up_to_10(amount):
+    """10원 단위 올림 (정확한 정수 올림, float 미사용)"""
+    return int(-(-_exact(amount) // 10) * 10)
+
+
+def _discount_per_unit(input_total, setting_amount, target_count, month_count=1):
+    """할인(복지/바우처) 세대당 금액과 실제 적용 총액 (Fraction).
+
+    고지서에 입력된 할인 총액이 있으면 대상 세대에 균등 분배하고,
+    없으면 설정 금액 x 개월수를 세대별로 적용한다.
+    """
+    if input_total > 0 and target_count:
+        return input_total / target_count, input_total
+    if target_count:
+        per_unit = setting_amount * month_count
+        return per_unit, per_unit * target_count
+    return Fraction(0), Fraction(0)
+
+
+def allocate_electric_batch(floors):
+    """여러 층(또는 여러 달)의 전기요금을 한 번에 배분.
+
+    floors: [{'units': [...], 'total_amount': ..., 그 밖의 allocate_electric 인자}, ...]
+    반환: floors 와 같은 순서의 [{'details', 'welfare_discount', 'voucher_discount'}, ...]
+    """
+    return [_allocate_electric_floor(**floor) for floor in floors]
+
+
+def allocate_electric(units, total_amount, **options):
+    """층 하나의 전기요금 배분 (allocate_electric_batch 의 단건 형태).
+
+    units: [{'unit_id', 'previous_reading', 'current_reading',
+             'electric_welfare', 'electric_voucher', 'has_tv'}, ...] (재실 세대만)
+    options: tv_fee_total, tv_distribution_mode('INDIVIDUAL'|'EQUAL'), tv_fee, month_count,
+             welfare_input, voucher_input, welfare_setting, voucher_setting
+    반환: {'details': [...], 'welfare_discount': 총 복지할인, 'voucher_discount': 총 바우처할인}
+    """
+    return allocate_electric_batch([dict(options, units=units, total_amount=total_amount)])[0]
+
+
+def _allocate_electric_floor(units, total_amount, tv_fee_total=0, tv_distribution_mode='INDIVIDUAL', tv_fee=0,
+                             month_count=1, welfare_input=0, voucher_input=0, welfare_setting=0, voucher_setting=0):
+    total_amount = _exact(total_amount)
+    count = len(units)
+
+    usages = [to_decimal(u['current_reading']) - to_decimal(u['previous_reading']) for u in units]
+    total_usage = sum(usages, ZERO)
+
+    if tv_distribution_mode == 'EQUAL':
+        tv_fee_per_unit = (_exact(tv_fee_total) / count) if count else Fraction(0)
+    else:
+        tv_fee_per_unit = _exact(tv_fee) * month_count
+
+    welfare_per_unit, welfare_total = _discount_per_unit(
+        _exact(welfare_input), _exact(welfare_setting),
+        sum(1 for u in units if u['electric_welfare']), month_count)
+    voucher_per_unit, voucher_total = _discount_per_unit(
+        _exact(voucher_input), _exact(voucher_setting),
+        sum(1 for u in units if u['electric_voucher']), month_count)
+
+    # 할인 전 원금액 = 고지 금액 + 적용된 할인 총액
+    original_amount = total_amount + welfare_total + voucher_total
+    equal_share = (original_amount / count) if count else Fraction(0)
+
+    details = []
+    for u, usage in zip(units, usages):
+        base_amount = _exact(usage) * original_amount / _exact(total_usage) if total_usage > 0 else equal_share
+        unit_welfare = welfare_per_unit if u['electric_welfare'] else Fraction(0)
+        unit_voucher = voucher_per_unit if u['electric_voucher'] else Fraction(0)
+        if tv_distribution_mode == 'EQUAL':
+            unit_tv_fee = tv_fee_per_unit
+        else:
+            unit_tv_fee = tv_fee_per_unit if u['has_tv'] else Fraction(0)
+
+        final_amount = max(base_amount - unit_welfare - unit_voucher + unit_tv_fee, Fraction(0))
+        details.append({
+            'unit_id': u['unit_id'],
+            'usage_amount': usage,
+            'base_amount': _record(base_amount),
+            'welfare_discount': _record(unit_welfare),
+            'voucher_discount': _record(unit_voucher),
+            'tv_fee': _record(unit_tv_fee),
+            'final_amount': _record(final_amount),
+            'charged_amount': Decimal(round_up_to_10(final_amount)),
+        })
+
+    return {'details': details, 'welfare_discount': _record(welfare_total),
+            'voucher_discount': _record(voucher_total)}
+
+
+def allocate_water(units, total_amount, welfare_input=0, welfare_setting=0, excluded_unit_ids=()):
+    """건물 전체 수도요금 배분 (거주 인원 비례, 제외 세대는 0원).
+
+    units: [{'unit_id', 'residents_count', 'water_welfare'}, ...] (재실 세대)
+    반환: {'details': [...], 'welfare_discount_total': 총 복지할인}
+    """
+    total_amount = _exact(total_amount)
+    excluded = set(excluded_unit_ids)
+    included = [u for u in units if u['unit_id'] not in excluded]
+    total_residents = sum(u['residents_count'] for u in included)
+
+    welfare_per_unit, welfare_total = _discount_per_unit(
+        _exact(welfare_input), _exact(welfare_setting),
+        sum(1 for u in included if u['water_welfare']))
+
+    original_amount = total_amount + welfare_total
+
+    details = []
+    for u in units:
+        if u['unit_id'] in excluded:
+            details.append({
+                'unit_id': u['unit_id'], 'base_amount': ZERO, 'welfare_discount': ZERO,
+                'final_amount': ZERO, 'charged_amount': ZERO, 'is_excluded': True,
+            })
+            continue
+
+        if total_residents > 0:
+            base_amount = original_amount * u['residents_count'] / total_residents
+        elif included:
+            base_amount = original_amount / len(included)
+        else:
+            base_amount = Fraction(0)
+
+        unit_welfare = welfare_per_unit if u['water_welfare'] else Fraction(0)
+        final_amount = max(base_amount - unit_welfare, Fraction(0))
+        details.append({
+            'unit_id': u['unit_id'],
+            'base_amount': _record(base_amount),
+            'welfare_discount': _record(unit_welfare),
+            'final_amount': _record(final_amount),
+            'charged_amount': Decimal(round_up_to_10(final_amount)),
+            'is_excluded': False,
+        })
+
+    return {'details': details, 'welfare_discount_total': _record(welfare_total)}
+
+
+def allocate_common(units, total_amount, distribution_method='BY_RESIDENTS'):
+    """공동 공과금 배분 (BY_RESIDENTS: 인원 비례, BY_UNITS: 세대 균등).
+
+    units: [{'unit_id', 'residents_count'}, ...] (재실 세대)
+    반환: {'details': [{'unit_id', 'amount', 'charged_amount'}, ...]}
+    """
+    total_amount = _exact(total_amount)
+    count = len(units)
+    equal_share = (total_amount / count) if count else Fraction(0)
+    total_residents = sum(u['residents_count'] for u in units) if distribution_method == 'BY_RESIDENTS' else 0
+
+    details = []
+    for u in units:
+        if total_residents > 0:
+            amount = total_amount * u['residents_count'] / total_residents
+        else:
+            amount = equal_share
+        details.append({
+            'unit_id': u['unit_id'],
+            'amount': _record(amount),
+            'charged_amount': Decimal(round_up_to_10(amount)),
+        })
+    return {'details': details}
@@ -0,0 +1,422 @@
+"""성능 기준선 측정 (합성 건물/이력 데이터 + Flask 테스트 클라이언트)
+
+    python bench.py --floors 5 --units-per-floor 8 --years 3 --output baseline.json
+    python bench.py --floors 5 --units-per-floor 8 --years 3 --compare baseline.json
+
+DATABASE_URL(또는 --database-url)을 지정하지 않으면 임시 SQLite 파일에 데이터를 만든다.
+MySQL 등 기존 DB 를 지정했을 때 데이터가 있으면 --reset 없이는 실행하지 않는다 (--reset 은 전체 테이블 삭제).
+--compare 는 중앙값이 임계치 이상 느려졌거나 쿼리 수가 늘어난 시나리오가 있으면 종료 코드 1 을 반환한다.
+조회 쿼리의 실행 계획(인덱스 사용) 확인은 tests/test_query_plans.py 에서 한다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+
+CSRF = 'bench-csrf-token'
+START_MONTH = date(2020, 1, 1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='공과금 정산 성능 기준선 측정')
+    parser.add_argument('--floors', type=int, default=3)
+    parser.add_argument('--units-per-floor', type=int, default=6)
+    parser.add_argument('--years', type=int, default=2, help='월별 고지서/정산서를 만들 기간(년)')
+    parser.add_argument('--vacancy-rate', type=float, default=0.1)
+    parser.add_argument('--common-every', type=int, default=3, help='공동 공과금 발생 주기(개월)')
+    parser.add_argument('--repeat', type=int, default=10, help='시나리오별 측정 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--database-url', help='미지정 시 DATABASE_URL, 그것도 없으면 임시 SQLite')
+    parser.add_argument('--reset', action='store_true', help='대상 DB 의 기존 테이블을 모두 삭제하고 시작')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--compare', help='비교할 기준선 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀 판정 비율 (기본 20%%)')
+    parser.add_argument('--only', nargs='*', help='실행할 시나리오 이름')
+    return parser.parse_args(argv)
+
+
+def month_str(index):
+    year, month = divmod(START_MONTH.month - 1 + index, 12)
+    return f'{START_MONTH.year + year:04d}-{month + 1:02d}'
+
+
+# ======================================================
+# Synthetic data
+# ======================================================
+class SyntheticBuilding:
+    """층/세대와 N년치 월별 고지서·정산서·납부 이력을 실제 엔드포인트로 생성"""
+
+    def __init__(self, bill_app, client, args):
+        self.app = bill_app
+        self.client = client
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.readings = {}
+        self.floor_units = {}
+        self.months = args.years * 12
+
+    def post(self, url, **kwargs):
+        response = self.client.post(url, **kwargs)
+        body = response.get_json(silent=True) or {}
+        if response.status_code != 200 or not body.get('success'):
+            raise RuntimeError(f'{url} 실패: {response.status_code} {body.get("message")}')
+        return body
+
+    def build(self):
+        started = time.perf_counter()
+        self.create_units()
+        for index in range(self.months):
+            self.create_month(index)
+        payments = self.create_payments()
+        return {'months': self.months, 'units': sum(len(u) for u in self.floor_units.values()),
+                'payments': payments, 'seconds': round(time.perf_counter() - started, 2)}
+
+    def create_units(self):
+        a = self.app
+        with a.app.app_context():
+            for number in range(1, self.args.floors + 1):
+                floor = a.Floor(floor_number=number, name=f'{number}층')
+                a.db.session.add(floor)
+                a.db.session.flush()
+                for n in range(1, self.args.units_per_floor + 1):
+                    a.db.session.add(a.Unit(
+                        floor_id=floor.id, unit_name=f'{number}{n:02d}',
+                        residents_count=self.rng.randint(1, 4),
+                        is_vacant=self.rng.random() < self.args.vacancy_rate,
+                        electric_welfare=self.rng.random() < 0.1,
+                        has_tv=self.rng.random() < 0.7,
+                        water_welfare=self.rng.random() < 0.05))
+                a.db.session.flush()
+                self.floor_units[floor.id] = [u.id for u in floor.units if not u.is_vacant]
+            a.db.session.commit()
+        for unit_ids in self.floor_units.values():
+            for unit_id in unit_ids:
+                self.readings[unit_id] = self.rng.randint(1000, 5000)
+
+    def electric_floor_input(self, month, floor_id):
+        readings = {}
+        for unit_id in self.floor_units[floor_id]:
+            prev = self.readings[unit_id]
+            curr = prev + self.rng.randint(50, 400)
+            readings[str(unit_id)] = {'prev': prev, 'curr': curr}
+            self.readings[unit_id] = curr
+        return {'floor_id': floor_id, 'tv_distribution_mode': 'INDIVIDUAL', 'readings': readings,
+                'months': [{'month': month, 'amount': self.rng.randint(80, 400) * 1000,
+                            'welfare': 0, 'voucher': 0, 'tv_fee': 2500}]}
+
+    def create_month(self, index):
+        month = month_str(index)
+        self.post('/calculate/electric/batch', json={
+            '_csrf_token': CSRF, 'billing_month': month,
+            'floors': [self.electric_floor_input(month, f) for f in self.floor_units]})
+        self.post('/calculate/water', data={
+            '_csrf_token': CSRF, 'billing_month': month, 'total_amount': self.rng.randint(150, 600) * 1000})
+        if index % self.args.common_every == 0:
+            self.post('/calculate/common', data={
+                '_csrf_token': CSRF, 'billing_month': month, 'description': '청소비',
+                'total_amount': self.rng.randint(50, 200) * 1000, 'distribution_method': 'BY_RESIDENTS'})
+        self.post('/invoice/create', json={'_csrf_token': CSRF, 'name': f'{month} 정산',
+                                           'items': self.month_items(month)})
+
+    def month_items(self, month):
+        a = self.app
+        billing_month = datetime.strptime(month, '%Y-%m').date()
+        with a.app.app_context():
+            items = [{'type': 'ELECTRIC', 'id': b.id, 'month': f'{month}-01'}
+                     for b in a.ElectricBill.query.filter_by(billing_month=billing_month)]
+            items += [{'type': 'WATER', 'id': b.id, 'month': f'{month}-01'}
+                      for b in a.WaterBill.query.filter_by(billing_month=billing_month)]
+            items += [{'type': 'COMMON', 'id': b.id, 'month': f'{month}-01', 'description': b.description}
+                      for b in a.CommonBill.query.filter_by(billing_month=billing_month)]
+        return items
+
+    def create_payments(self):
+        """정산서별 세대 청구액의 90% 완납, 5% 부분 납부, 5% 미납"""
+        a = self.app
+        with a.app.app_context():
+            rows = []
+            for inv in a.FinalInvoice.query.order_by(a.FinalInvoice.id):
+                roll = self.rng.random()
+                if roll >= 0.95:
+                    continue
+                amount = inv.total_amount if roll < 0.9 else (inv.total_amount / 2).quantize(inv.total_amount)
+                rows.append({'combination_id': inv.combination_id, 'unit_id': inv.unit_id,
+                             'payment_date': (inv.created_at or datetime.utcnow()).date(),
+                             'payment_amount': amount, 'payment_method': '계좌이체', 'memo': ''})
+            a.bulk_insert_rows(a.Payment, rows)
+            # 라우트를 거치지 않는 일괄 insert 이므로 원장과 월별 요약을 원본 기준으로 다시 만든다
+            a.rebuild_unit_ledgers()
+            a.rebuild_monthly_summaries()
+            a.db.session.commit()
+        return len(rows)
+
+
+# ======================================================
+# Scenarios
+# ======================================================
+class Scenarios:
+    """시나리오: (준비, 측정 요청, 정리). 측정 구간은 요청 하나"""
+
+    def __init__(self, bill_app, client, building):
+        self.app = bill_app
+        self.client = client
+        self.building = building
+        self.last_month = month_str(building.months - 1)
+        with bill_app.app.app_context():
+            a = bill_app
+            self.floor_id = next(iter(building.floor_units))
+            self.latest_combination_id = a.db.session.query(a.func.max(a.InvoiceCombination.id)).scalar()
+            self.electric_prev = {}
+            bill = a.ElectricBill.query.filter_by(
+                floor_id=self.floor_id, billing_month=datetime.strptime(self.last_month, '%Y-%m').date()).one()
+            for r in a.ElectricReading.query.filter_by(electric_bill_id=bill.id):
+                self.electric_prev[r.unit_id] = (r.previous_reading, r.current_reading)
+            self.electric_bill_id = bill.id
+            # 고지서 목록 마지막 페이지 (OFFSET 이 가장 큰 페이지)
+            self.electric_last_page = max(-(-a.ElectricBill.query.count() // a.VIEW_PAGE_SIZE), 1)
+        self.toggle = 0
+        self.created_combination = None
+
+    def names(self):
+        return ['calculate_electric', 'calculate_water', 'create_invoice', 'view_bills', 'view_bills_last_page',
+                'view_bill_details', 'view_bills_summary', 'all_units_balance', 'dashboard', 'print_invoice', 'print_invoice_cached']
+
+    # 재계산은 매번 다른 입력으로 (증분 갱신이 실제로 행을 바꾸도록)
+    def calculate_electric(self):
+        self.toggle ^= 1
+        form = {'_csrf_token': CSRF, 'billing_month': self.last_month, 'floor_id': self.floor_id,
+                'overwrite': 'true', 'month_count': '1', 'month_0': self.last_month,
+                'amount_0': str(200000 + self.toggle * 1000), 'tv_fee_0': '2500'}
+        for unit_id, (prev, curr) in self.electric_prev.items():
+            form[f'prev_{unit_id}'] = str(prev)
+            form[f'curr_{unit_id}'] = str(curr + self.toggle)
+        return None, lambda: self.client.post('/calculate/electric', data=form), None
+
+    def calculate_water(self):
+        self.toggle ^= 1
+        form = {'_csrf_token': CSRF, 'billing_month': self.last_month, 'overwrite': 'true',
+                'total_amount': str(300000 + self.toggle * 1000)}
+        return None, lambda: self.client.post('/calculate/water', data=form), None
+
+    def create_invoice(self):
+        items = self.building.month_items(self.last_month)
+        payload = {'_csrf_token': CSRF, 'name': 'bench', 'items': items}
+
+        def run():
+            response = self.client.post('/invoice/create', json=payload)
+            self.created_combination = (response.get_json(silent=True) or {}).get('id')
+            return response
+
+        def cleanup():
+            if self.created_combination:
+                self.client.post(f'/invoice/delete/{self.created_combination}', json={'_csrf_token': CSRF})
+
+        return None, run, cleanup
+
+    # 조회 화면(/view)은 빈 틀만 그리고 아래 API 로 목록/상세/차트를 불러온다
+    def view_bills(self):
+        return None, lambda: self.client.get('/api/bills/electric?page=1'), None
+
+    def view_bills_last_page(self):
+        return None, lambda: self.client.get(f'/api/bills/electric?page={self.electric_last_page}'), None
+
+    def view_bill_details(self):
+        return None, lambda: self.client.get(f'/api/bills/electric/{self.electric_bill_id}/details'), None
+
+    def view_bills_summary(self):
+        return None, lambda: self.client.get('/api/bills/summary'), None
+
+    def all_units_balance(self):
+        return None, lambda: self.client.get('/payments/all_units_balance'), None
+
+    def dashboard(self):
+        return None, lambda: self.client.get('/'), None
+
+    def print_invoice(self):
+        def clear_cache():
+            with self.app.app.app_context():
+                self.app.invalidate_print_cache(self.latest_combination_id)
+
+        return clear_cache, lambda: self.client.get(f'/invoice/print/{self.latest_combination_id}'), None
+
+    def print_invoice_cached(self):
+        url = f'/invoice/print/{self.latest_combination_id}'
+        return lambda: self.client.get(url), lambda: self.client.get(url), None
+
+
+def check_response(name, response):
+    if response.status_code != 200:
+        raise RuntimeError(f'{name}: HTTP {response.status_code}')
+    body = response.get_json(silent=True)
+    if isinstance(body, dict) and body.get('success') is False:
+        raise RuntimeError(f'{name}: {body.get("message")}')
+
+
+def measure(bill_app, scenarios, name, repeat):
+    from sqlalchemy import event
+
+    with bill_app.app.app_context():
+        engine = bill_app.db.engine
+    counter = {'n': 0}
+
+    def count(*_):
+        counter['n'] += 1
+
+    def run_once(traced=False):
+        setup, run, cleanup = getattr(scenarios, name)()
+        if setup:
+            setup()
+        counter['n'] = 0
+        if traced:
+            tracemalloc.start()
+        started = time.perf_counter()
+        response = run()
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if traced:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        queries = counter['n']
+        check_response(name, response)
+        if cleanup:
+            cleanup()
+        return elapsed * 1000, queries, peak
+
+    event.listen(engine, 'before_cursor_execute', count)
+    try:
+        run_once()  # 워밍업
+        samples = [run_once() for _ in range(repeat)]
+        peak = run_once(traced=True)[2]  # tracemalloc 은 느리므로 메모리는 별도 1회 측정
+    finally:
+        event.remove(engine, 'before_cursor_execute', count)
+
+    latencies = sorted(s[0] for s in samples)
+    p95_index = min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))
+    return {
+        'runs': repeat,
+        'median_ms': round(statistics.median(latencies), 3),
+        'p95_ms': round(latencies[p95_index], 3),
+        'min_ms': round(latencies[0], 3),
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'queries': int(statistics.median(s[1] for s in samples)),
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+# ======================================================
+# Baseline compare
+# ======================================================
+def compare(results, baseline, threshold):
+    """회귀 목록. 중앙값은 비율 + 최소 1ms 차이, 쿼리 수는 증가하면 회귀"""
+    regressions = []
+    print(f'\n{"scenario":<24}{"base ms":>10}{"new ms":>10}{"ratio":>8}{"base q":>8}{"new q":>8}')
+    for name, new in results.items():
+        old = baseline.get('results', {}).get(name)
+        if not old:
+            print(f'{name:<24}{"-":>10}{new["median_ms"]:>10.2f}{"new":>8}')
+            continue
+        ratio = new['median_ms'] / old['median_ms'] if old['median_ms'] else 1.0
+        slower = ratio > 1 + threshold and new['median_ms'] - old['median_ms'] > 1.0
+        more_queries = new['queries'] > old['queries']
+        flag = '  <-- REGRESSION' if slower or more_queries else ''
+        print(f'{name:<24}{old["median_ms"]:>10.2f}{new["median_ms"]:>10.2f}{ratio:>8.2f}'
+              f'{old["queries"]:>8}{new["queries"]:>8}{flag}')
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    workdir = tempfile.mkdtemp(prefix='bill-bench-')
+    if args.database_url:
+        os.environ['DATABASE_URL'] = args.database_url
+    elif not os.environ.get('DATABASE_URL'):
+        os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(workdir, "bench.db")}'
+    os.environ.setdefault('SECRET_KEY', 'bench')
+
+    import app as bill_app
+    import sqlalchemy
+
+    try:
+        bill_app.create_app({'PRINT_CACHE_DIR': os.path.join(workdir, 'print_cache')})
+        with bill_app.app.app_context():
+            has_data = sqlalchemy.inspect(bill_app.db.engine).has_table('floors') and \
+                bill_app.db.session.query(bill_app.Floor.id).first() is not None
+            if has_data and not args.reset:
+                sys.exit('대상 DB 에 데이터가 있습니다. 벤치마크 전용 DB 를 쓰거나 --reset 을 지정하세요.')
+            if args.reset:
+                bill_app.db.drop_all()
+                with bill_app.db.engine.begin() as conn:
+                    conn.exec_driver_sql('DROP TABLE IF EXISTS alembic_version')
+        bill_app.bootstrap_database()
+
+        client = bill_app.app.test_client()
+        with client.session_transaction() as sess:
+            sess['_csrf_token'] = CSRF
+
+        building = SyntheticBuilding(bill_app, client, args)
+        dataset = building.build()
+        print(f'[bench] 데이터 생성: {dataset}')
+
+        scenarios = Scenarios(bill_app, client, building)
+        results = {}
+        for name in scenarios.names():
+            if args.only and name not in args.only:
+                continue
+            results[name] = measure(bill_app, scenarios, name, args.repeat)
+            r = results[name]
+            print(f'[bench] {name:<22} median {r["median_ms"]:>9.2f}ms  p95 {r["p95_ms"]:>9.2f}ms  '
+                  f'queries {r["queries"]:>4}  peak {r["peak_kb"]:>9.1f}KB')
+
+        report = {
+            'meta': {
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'git_revision': git_revision(),
+                'backend': sqlalchemy.engine.make_url(os.environ['DATABASE_URL']).get_backend_name(),
+                'python': platform.python_version(),
+                'sqlalchemy': sqlalchemy.__version__,
+                'params': {k: getattr(args, k) for k in ('floors', 'units_per_floor', 'years', 'vacancy_rate',
+                                                         'common_every', 'repeat', 'seed')},
+                'dataset': dataset,
+            },
+            'results': results,
+        }
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f'[bench] 저장: {args.output}')
+
+        if args.compare:
+            with open(args.compare, encoding='utf-8') as f:
+                baseline = json.load(f)
+            if baseline.get('meta', {}).get('params') != report['meta']['params']:
+                print('[bench] 경고: 기준선과 데이터 규모/반복 설정이 다릅니다.')
+            regressions = compare(results, baseline, args.threshold)
+            if regressions:
+                print(f'[bench] 회귀: {", ".join(regressions)}')
+                return 1
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
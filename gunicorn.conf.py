@@ -0,0 +1,15 @@
+# gunicorn -c gunicorn.conf.py wsgi:app
+#
+# 워커(프로세스)마다 커넥션 풀이 따로 생기므로 DB 최대 연결 수는
+#   workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+# 이고, 워커당 threads 는 DB_POOL_SIZE + DB_MAX_OVERFLOW 를 넘지 않게 맞춘다. (/admin/pool_stats 참고)
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('WEB_THREADS', 4))
+# 대량 계산·CSV 내보내기 요청을 고려한 여유 시간
+timeout = int(os.environ.get('WEB_TIMEOUT', 120))
+accesslog = '-'
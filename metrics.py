@@ -0,0 +1,144 @@
+"""요청 시간·SQL 계측 집계 (Flask/DB 비의존)
+
+요청 하나의 측정값(RequestTimer)을 엔드포인트별 히스토그램(EndpointStats)에 누적한다.
+백분위는 버킷 경계값으로 근사하며, 집계는 워커 프로세스별이다.
+"""
+import heapq
+import threading
+import time
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 상한 없음
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+PERCENTILES = (50, 90, 95, 99)
+SLOW_STATEMENTS_PER_ENDPOINT = 5
+STATEMENT_TEXT_LIMIT = 300
+
+
+class RequestTimer:
+    """요청 하나의 벽시계 시간과 SQL 실행 횟수·시간"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.slowest = []  # (초, SQL) 상위 N개 (min-heap)
+
+    def record_sql(self, statement, elapsed):
+        self.sql_count += 1
+        self.sql_time += elapsed
+        entry = (elapsed, statement)
+        if len(self.slowest) < SLOW_STATEMENTS_PER_ENDPOINT:
+            heapq.heappush(self.slowest, entry)
+        elif elapsed > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+    def server_timing(self, total):
+        """Server-Timing 헤더 값 (ms)"""
+        db_ms = self.sql_time * 1000
+        total_ms = total * 1000
+        return (f'db;dur={db_ms:.1f};desc="{self.sql_count} queries", '
+                f'app;dur={max(total_ms - db_ms, 0):.1f}, total;dur={total_ms:.1f}')
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value_ms):
+        index = len(BUCKET_BOUNDS_MS)
+        for i, bound in enumerate(BUCKET_BOUNDS_MS):
+            if value_ms <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, p):
+        """p 백분위가 속한 버킷의 상한 (관측 최댓값을 넘지 않게)"""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                bound = BUCKET_BOUNDS_MS[i] if i < len(BUCKET_BOUNDS_MS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 2) if self.count else 0.0,
+            'max': round(self.max, 2),
+            **{f'p{p}': round(self.percentile(p), 2) for p in PERCENTILES},
+            'buckets': [{'le': bound, 'count': n}
+                        for bound, n in zip(BUCKET_BOUNDS_MS + (None,), self.counts)],
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.wall = Histogram()
+        self.db = Histogram()
+        self.sql_count_total = 0
+        self.sql_count_max = 0
+        self.slowest = []  # (ms, SQL) 상위 N개 (min-heap)
+
+    def add(self, wall_ms, timer):
+        self.wall.add(wall_ms)
+        self.db.add(timer.sql_time * 1000)
+        self.sql_count_total += timer.sql_count
+        self.sql_count_max = max(self.sql_count_max, timer.sql_count)
+        for elapsed, statement in timer.slowest:
+            entry = (round(elapsed * 1000, 2), ' '.join(statement.split())[:STATEMENT_TEXT_LIMIT])
+            if len(self.slowest) < SLOW_STATEMENTS_PER_ENDPOINT:
+                heapq.heappush(self.slowest, entry)
+            elif entry[0] > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def summary(self):
+        count = self.wall.count
+        return {
+            'wall_ms': self.wall.summary(),
+            'db_ms': self.db.summary(),
+            'sql_avg': round(self.sql_count_total / count, 1) if count else 0.0,
+            'sql_max': self.sql_count_max,
+            'slowest': [{'ms': ms, 'sql': sql} for ms, sql in sorted(self.slowest, reverse=True)],
+        }
+
+
+class RequestMetrics:
+    """엔드포인트별 요청 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.endpoints = {}
+
+    def record(self, endpoint, wall_seconds, timer):
+        with self._lock:
+            stats = self.endpoints.get(endpoint)
+            if stats is None:
+                stats = self.endpoints[endpoint] = EndpointStats()
+            stats.add(wall_seconds * 1000, timer)
+
+    def snapshot(self):
+        with self._lock:
+            endpoints = {name: stats.summary() for name, stats in self.endpoints.items()}
+            return {'since': self.started_at, 'endpoints': endpoints}
+
+
+REQUEST_METRICS = RequestMetrics()
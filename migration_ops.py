@@ -0,0 +1,233 @@
+"""마이그레이션 리비전에서 쓰는 운영 중 안전한 스키마 변경 도우미 (migrations/versions 에서 import)
+
+- 인덱스 추가/삭제: MySQL 은 ALGORITHM=INPLACE, LOCK=NONE 으로 쓰기를 막지 않고, PostgreSQL 은 CONCURRENTLY 로 만든다.
+  같은 컬럼 구성의 인덱스가 이미 있으면(이름이 달라도) 건너뛰므로 손으로 인덱스를 만든 DB 에서도 안전하다.
+- 컬럼 추가: NULL 허용 또는 서버 기본값이 있는 컬럼만 허용한다 (MySQL 8 은 INSTANT, 테이블 재작성 없음).
+- 값 채우기: 기본 키 구간 단위로 나눠 커밋해 큰 상세 테이블을 오래 잠그지 않는다.
+  SQL 로 표현할 수 없는 값(JSON 분류, 해시)은 구간별로 읽어 파이썬에서 계산한다.
+- NOT NULL/외래 키/유니크 키 변경: 값을 채운 뒤 적용한다. SQLite 는 ALTER 로 제약을 바꿀 수 없어 batch 모드(테이블 재생성),
+  MySQL 은 INPLACE, PostgreSQL 은 NOT VALID 제약을 먼저 만들고 나중에 검증해 쓰기를 오래 막지 않는다.
+
+SQL 출력 모드(db upgrade --sql)에서는 DB 를 조회할 수 없으므로 존재 확인 없이 문장을 출력하고,
+있을 때만 지우는 기존 인덱스(optional=True)는 주석으로 남긴다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _dialect():
+    return op.get_context().dialect.name
+
+
+def _offline():
+    return op.get_context().as_sql
+
+
+def has_table(table):
+    if _offline():
+        return False
+    return _inspector().has_table(table)
+
+
+def has_column(table, column):
+    if _offline():
+        return False
+    return any(c['name'] == column for c in _inspector().get_columns(table))
+
+
+def find_index(table, columns, unique=False):
+    """같은 컬럼 구성의 인덱스/유니크 키 이름 (없으면 None). 유니크가 아니면 앞쪽 컬럼이 같은 인덱스도 인정"""
+    if _offline():
+        return None
+    inspector = _inspector()
+    columns = tuple(columns)
+    existing = [(ix['name'], tuple(ix['column_names']), bool(ix['unique'])) for ix in inspector.get_indexes(table)]
+    existing += [(uc['name'], tuple(uc['column_names']), True) for uc in inspector.get_unique_constraints(table)]
+    for name, cols, is_unique in existing:
+        if unique and is_unique and cols == columns:
+            return name
+        if not unique and cols[:len(columns)] == columns:
+            return name
+    return None
+
+
+def assert_no_duplicates(table, columns):
+    """유니크 키를 추가하기 전에 중복 행이 없는지 확인 (있으면 데이터를 건드리지 않고 중단)"""
+    if _offline():
+        return
+    cols = ', '.join(columns)
+    count = op.get_bind().execute(sa.text(
+        f'SELECT COUNT(*) FROM (SELECT {cols} FROM {table} GROUP BY {cols} HAVING COUNT(*) > 1) AS dup')).scalar()
+    if count:
+        raise RuntimeError(f'{table} ({cols}) 에 중복 행 {count}건이 있어 유니크 키를 추가할 수 없습니다. '
+                           f'중복을 정리한 뒤 다시 실행하세요.')
+
+
+def create_index_online(name, table, columns, unique=False, skip_if_covered=True):
+    """인덱스 추가 (같은 컬럼 구성의 인덱스가 있으면 건너뜀). 반환: 새로 만들었는지 여부"""
+    if skip_if_covered and find_index(table, columns, unique):
+        return False
+    if unique:
+        assert_no_duplicates(table, columns)
+    dialect = _dialect()
+    if dialect == 'mysql':
+        kind = 'UNIQUE INDEX' if unique else 'INDEX'
+        op.execute(f"ALTER TABLE {table} ADD {kind} {name} ({', '.join(columns)}), ALGORITHM=INPLACE, LOCK=NONE")
+    elif dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, list(columns), unique=unique, postgresql_concurrently=True)
+    else:
+        op.create_index(name, table, list(columns), unique=unique)
+    return True
+
+
+def drop_index_online(name, table, optional=False):
+    """인덱스 삭제 (없으면 건너뜀). optional: 예전 스키마에만 있을 수 있는 인덱스"""
+    if _offline():
+        if optional:
+            op.execute(f'-- {table}.{name} 인덱스가 있으면 제거')
+            return False
+    else:
+        names = {ix['name'] for ix in _inspector().get_indexes(table)}
+        names |= {uc['name'] for uc in _inspector().get_unique_constraints(table)}
+        if name not in names:
+            return False
+    dialect = _dialect()
+    if dialect == 'mysql':
+        op.execute(f'ALTER TABLE {table} DROP INDEX {name}, ALGORITHM=INPLACE, LOCK=NONE')
+    elif dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    else:
+        op.drop_index(name, table_name=table)
+    return True
+
+
+def add_column_online(table, column):
+    """컬럼 추가 (이미 있으면 건너뜀). NOT NULL 컬럼은 server_default 가 있어야 한다"""
+    if has_column(table, column.name):
+        return False
+    if not column.nullable and column.server_default is None:
+        raise ValueError(f'{table}.{column.name}: NOT NULL 컬럼은 server_default 를 지정하거나, '
+                         f'NULL 허용으로 추가 후 값을 채우고 다음 리비전에서 NOT NULL 로 바꾸세요.')
+    op.add_column(table, column)
+    return True
+
+
+def _key_ranges(table, key, batch_size):
+    low, high = op.get_bind().execute(sa.text(f'SELECT MIN({key}), MAX({key}) FROM {table}')).one()
+    if low is None:
+        return []
+    return [(start, start + batch_size - 1) for start in range(low, high + 1, batch_size)]
+
+
+def backfill_in_batches(table, set_sql, where_sql='1=1', batch_size=5000, params=None, key='id'):
+    """UPDATE {table} SET {set_sql} 를 기본 키(key) 구간별로 나눠 실행하고 구간마다 커밋
+
+    set_sql/where_sql 은 SQL 조각 (예: "amount_total = electric_amount + water_amount", "amount_total IS NULL").
+    반환: 갱신한 행 수
+    """
+    if _offline():
+        op.execute(sa.text(f'UPDATE {table} SET {set_sql} WHERE {where_sql}').bindparams(**(params or {})))
+        return 0
+    updated = 0
+    stmt = sa.text(f'UPDATE {table} SET {set_sql} WHERE {key} BETWEEN :lo AND :hi AND ({where_sql})')
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for lo, hi in _key_ranges(table, key, batch_size):
+            result = bind.execute(stmt, {'lo': lo, 'hi': hi, **(params or {})})
+            updated += result.rowcount or 0
+    return updated
+
+
+def backfill_rows_in_batches(table, columns, compute, types, where_sql='1=1', batch_size=1000):
+    """기본 키(id) 구간별로 columns 를 읽어 compute(bind, row) 가 돌려준 값으로 행마다 UPDATE 하고 구간마다 커밋
+
+    compute 는 {컬럼: 값} 을 돌려준다 (row 는 id 와 columns 를 가진 Row). types: {컬럼: SQLAlchemy 타입} (값 변환용).
+    SQL 출력 모드에서는 실행하지 않고 주석만 남긴다. 반환: 갱신한 행 수
+    """
+    if _offline():
+        op.execute(f'-- {table}: {where_sql} 인 행을 마이그레이션 리비전의 계산으로 채울 것 (온라인 실행 필요)')
+        return 0
+    select = sa.text(f"SELECT id, {', '.join(columns)} FROM {table} "
+                     f"WHERE id BETWEEN :lo AND :hi AND ({where_sql})")
+    updated = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for lo, hi in _key_ranges(table, 'id', batch_size):
+            changes = [(row.id, compute(bind, row)) for row in bind.execute(select, {'lo': lo, 'hi': hi})]
+            for row_id, values in changes:
+                assignments = ', '.join(f'{column} = :{column}' for column in values)
+                stmt = sa.text(f'UPDATE {table} SET {assignments} WHERE id = :id').bindparams(
+                    *[sa.bindparam(column, type_=types[column]) for column in values])
+                bind.execute(stmt, {'id': row_id, **values})
+            updated += len(changes)
+    return updated
+
+
+def _type_sql(type_):
+    return type_.compile(dialect=op.get_context().dialect)
+
+
+def set_not_null(table, column, type_):
+    """값을 모두 채운 컬럼을 NOT NULL 로 변경"""
+    dialect = _dialect()
+    if dialect == 'mysql':
+        op.execute(f'ALTER TABLE {table} MODIFY {column} {_type_sql(type_)} NOT NULL, ALGORITHM=INPLACE, LOCK=NONE')
+    elif dialect == 'postgresql':
+        # 검증된 CHECK 제약이 있으면 SET NOT NULL 이 테이블을 다시 읽지 않는다 (PostgreSQL 12+)
+        check = f'ck_{table}_{column}_not_null'
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {check} CHECK ({column} IS NOT NULL) NOT VALID')
+        op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {check}')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL')
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT {check}')
+    else:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=type_, nullable=False)
+
+
+def create_foreign_key_online(name, table, columns, ref_table, ref_columns, ondelete=None):
+    """외래 키 추가. 참조 값은 미리 채워져 있어야 한다 (MySQL 은 검사 없이 INPLACE 로 추가)"""
+    dialect = _dialect()
+    cols, ref_cols = ', '.join(columns), ', '.join(ref_columns)
+    on_delete = f' ON DELETE {ondelete}' if ondelete else ''
+    if dialect == 'mysql':
+        # foreign_key_checks=0 일 때만 INPLACE 로 추가된다 (기존 행 검사 생략, 값은 리비전에서 채운 뒤)
+        op.execute('SET foreign_key_checks = 0')
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({cols}) '
+                   f'REFERENCES {ref_table} ({ref_cols}){on_delete}, ALGORITHM=INPLACE, LOCK=NONE')
+        op.execute('SET foreign_key_checks = 1')
+    elif dialect == 'postgresql':
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({cols}) '
+                   f'REFERENCES {ref_table} ({ref_cols}){on_delete} NOT VALID')
+        op.execute(f'ALTER TABLE {table} VALIDATE CONSTRAINT {name}')
+    else:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.create_foreign_key(name, ref_table, list(columns), list(ref_columns), ondelete=ondelete)
+
+
+# SQLite 에서 이름 없이 만든 유니크 키(create_all)를 batch 모드로 지울 때 붙일 이름
+SQLITE_NAMING = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+
+
+def replace_unique_online(table, old_columns, name, columns):
+    """유니크 키 교체: 새 키(columns)를 만든 뒤 기존 키(old_columns, 이름은 DB 마다 다름)를 제거"""
+    old_name = find_index(table, old_columns, unique=True)
+    if _dialect() == 'sqlite':
+        with op.batch_alter_table(table, naming_convention=SQLITE_NAMING) as batch_op:
+            batch_op.drop_constraint(old_name or f'uq_{table}_{old_columns[0]}', type_='unique')
+            batch_op.create_unique_constraint(name, list(columns))
+        return
+    create_index_online(name, table, columns, unique=True)
+    if old_name is None:
+        if _offline():
+            op.execute(f"-- {table} ({', '.join(old_columns)}) 유니크 키가 있으면 제거")
+        return
+    if _dialect() == 'postgresql' and old_name in {uc['name'] for uc in _inspector().get_unique_constraints(table)}:
+        op.drop_constraint(old_name, table, type_='unique')
+    else:
+        drop_index_online(old_name, table)
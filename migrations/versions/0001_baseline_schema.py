@@ -0,0 +1,222 @@
+"""baseline schema
+
+마이그레이션 도입 전 스키마 (db.create_all() 로 만든 DB 또는 SQLSchema.txt 9번까지 적용한 DB).
+버전 정보가 없는 기존 DB 는 bootstrap_database 가 컬럼을 비교한 뒤 이 리비전으로 표시(stamp)하고 이후 리비전을 적용한다.
+이후 변경(건물, 원장, 스냅샷, stale 표시, 세션 저장소 ...)은 0002 부터 리비전별로 추가한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 13:28:52.633232
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('settings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('setting_key', sa.String(length=50), nullable=False),
+    sa.Column('setting_value', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('setting_key')
+    )
+    op.create_table('common_bills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('billing_month', sa.Date(), nullable=False),
+    sa.Column('description', sa.String(length=255), nullable=True),
+    sa.Column('total_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('distribution_method', sa.Enum('BY_RESIDENTS', 'BY_UNITS'), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('floors',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('floor_number', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=50), nullable=True),
+    sa.Column('electric_contract_number', sa.String(length=50), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('floor_number', name='uq_floors_floor_number')
+    )
+    op.create_table('invoice_combinations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('invoice_name', sa.String(length=255), nullable=False),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('water_bills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('billing_month', sa.Date(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('welfare_discount_total', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('billing_month', name='uq_water_bills_billing_month')
+    )
+    op.create_table('electric_bills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('billing_month', sa.Date(), nullable=False),
+    sa.Column('floor_id', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('welfare_discount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('voucher_discount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('tv_fee_total', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('tv_distribution_mode', sa.String(length=20), nullable=True),
+    sa.Column('tv_units_count', sa.Integer(), nullable=True),
+    sa.Column('billing_months_count', sa.Integer(), nullable=True),
+    sa.Column('monthly_details', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['floor_id'], ['floors.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('units',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('floor_id', sa.Integer(), nullable=False),
+    sa.Column('unit_name', sa.String(length=50), nullable=False),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('electric_welfare', sa.Boolean(), nullable=True),
+    sa.Column('electric_voucher', sa.Boolean(), nullable=True),
+    sa.Column('has_tv', sa.Boolean(), nullable=True),
+    sa.Column('water_welfare', sa.Boolean(), nullable=True),
+    sa.Column('residents_count', sa.Integer(), nullable=True),
+    sa.Column('is_vacant', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['floor_id'], ['floors.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('common_bill_details',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('common_bill_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('charged_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('unit_snapshot', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['common_bill_id'], ['common_bills.id'], ),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('electric_bill_details',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('electric_bill_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('usage_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('base_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('welfare_discount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('voucher_discount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('tv_fee', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('final_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('charged_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('unit_snapshot', sa.JSON(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['electric_bill_id'], ['electric_bills.id'], ),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('electric_readings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('electric_bill_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('previous_reading', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('current_reading', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['electric_bill_id'], ['electric_bills.id'], ),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('final_invoices',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('combination_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('electric_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('water_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('common_amount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('common_details', sa.JSON(), nullable=True),
+    sa.Column('additional_charges', sa.JSON(), nullable=True),
+    sa.Column('total_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('unit_memo', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['combination_id'], ['invoice_combinations.id'], ),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('invoice_combination_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('combination_id', sa.Integer(), nullable=False),
+    sa.Column('item_type', sa.String(length=20), nullable=False),
+    sa.Column('billing_month', sa.Date(), nullable=False),
+    sa.Column('item_description', sa.String(length=200), nullable=True),
+    sa.Column('electric_bill_id', sa.Integer(), nullable=True),
+    sa.Column('water_bill_id', sa.Integer(), nullable=True),
+    sa.Column('common_bill_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['combination_id'], ['invoice_combinations.id'], ),
+    sa.ForeignKeyConstraint(['common_bill_id'], ['common_bills.id'], ),
+    sa.ForeignKeyConstraint(['electric_bill_id'], ['electric_bills.id'], ),
+    sa.ForeignKeyConstraint(['water_bill_id'], ['water_bills.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('payments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('combination_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('payment_date', sa.Date(), nullable=False),
+    sa.Column('payment_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('payment_method', sa.String(length=50), nullable=True),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['combination_id'], ['invoice_combinations.id'], ),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('water_bill_details',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('water_bill_id', sa.Integer(), nullable=False),
+    sa.Column('unit_id', sa.Integer(), nullable=False),
+    sa.Column('base_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('welfare_discount', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.Column('final_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('charged_amount', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('unit_snapshot', sa.JSON(), nullable=True),
+    sa.Column('is_excluded', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ),
+    sa.ForeignKeyConstraint(['water_bill_id'], ['water_bills.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('water_bill_details')
+    op.drop_table('payments')
+    op.drop_table('invoice_combination_items')
+    op.drop_table('final_invoices')
+    op.drop_table('electric_readings')
+    op.drop_table('electric_bill_details')
+    op.drop_table('common_bill_details')
+    op.drop_table('units')
+    op.drop_table('electric_bills')
+    op.drop_table('water_bills')
+    op.drop_table('invoice_combinations')
+    op.drop_table('floors')
+    op.drop_table('common_bills')
+    op.drop_table('settings')
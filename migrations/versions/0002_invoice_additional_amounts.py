@@ -0,0 +1,55 @@
+"""invoice additional amounts
+
+final_invoices 에 추가 항목 분류 컬럼(additional_amount: 실제 청구분, carryover_amount: 이월분)을 추가하고
+기존 정산서는 additional_charges 의 설명으로 나눠 채운다. 잔액 집계가 추가 항목 JSON 을 다시 읽지 않게 된다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:10:00.000000
+
+"""
+import json
+from decimal import Decimal
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import add_column_online, backfill_rows_in_batches
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# app.CARRYOVER_KEYWORDS 와 같은 분류 (리비전은 이후 앱 코드가 바뀌어도 그대로 동작하도록 복사해 둔다)
+CARRYOVER_KEYWORDS = ('미납', '초과납부', '환급', '이월')
+AMOUNT = sa.Numeric(precision=10, scale=2)
+
+
+def split_additional_charges(bind, row):
+    charges = row.additional_charges
+    if isinstance(charges, str):
+        charges = json.loads(charges)
+    billable = carryover = Decimal(0)
+    for charge in charges or []:
+        amount = Decimal(str(charge.get('amount') or 0))
+        if any(keyword in (charge.get('description') or '').lower() for keyword in CARRYOVER_KEYWORDS):
+            carryover += amount
+        else:
+            billable += amount
+    return {'additional_amount': billable, 'carryover_amount': carryover}
+
+
+def upgrade():
+    add_column_online('final_invoices', sa.Column('additional_amount', AMOUNT, nullable=True))
+    add_column_online('final_invoices', sa.Column('carryover_amount', AMOUNT, nullable=True))
+    backfill_rows_in_batches('final_invoices', ['additional_charges'], split_additional_charges,
+                             {'additional_amount': AMOUNT, 'carryover_amount': AMOUNT},
+                             'additional_amount IS NULL')
+
+
+def downgrade():
+    with op.batch_alter_table('final_invoices') as batch_op:
+        batch_op.drop_column('carryover_amount')
+        batch_op.drop_column('additional_amount')
@@ -0,0 +1,58 @@
+"""unit ledgers
+
+세대별 누적 원장(unit_ledgers). 정산서/납부 쓰기가 같은 트랜잭션에서 증분 갱신하며,
+기존 이력은 세대 id 구간별로 정산서/납부 합계를 집계해 채운다 (app.rebuild_unit_ledgers 와 같은 값).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 09:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import backfill_in_batches, has_table
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+BILLED = ('(SELECT COALESCE(SUM(f.electric_amount + f.water_amount + f.common_amount '
+          '+ COALESCE(f.additional_amount, 0)), 0) FROM final_invoices f WHERE f.unit_id = unit_ledgers.unit_id)')
+PAID = '(SELECT COALESCE(SUM(p.payment_amount), 0) FROM payments p WHERE p.unit_id = unit_ledgers.unit_id)'
+
+
+def upgrade():
+    if not has_table('unit_ledgers'):
+        op.create_table('unit_ledgers',
+        sa.Column('unit_id', sa.Integer(), nullable=False),
+        sa.Column('billed_total', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('paid_total', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('carryover_total', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('balance', sa.Numeric(precision=12, scale=2), nullable=False),
+        sa.Column('invoice_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['unit_id'], ['units.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('unit_id')
+        )
+    # 정산서나 납부가 있는 세대만 행을 둔다 (세대 수만큼의 작은 insert)
+    op.execute(
+        'INSERT INTO unit_ledgers (unit_id, billed_total, paid_total, carryover_total, balance, invoice_count) '
+        'SELECT u.id, 0, 0, 0, 0, 0 FROM units u '
+        'WHERE (EXISTS (SELECT 1 FROM final_invoices f WHERE f.unit_id = u.id) '
+        'OR EXISTS (SELECT 1 FROM payments p WHERE p.unit_id = u.id)) '
+        'AND NOT EXISTS (SELECT 1 FROM unit_ledgers l WHERE l.unit_id = u.id)')
+    backfill_in_batches(
+        'unit_ledgers',
+        f'billed_total = {BILLED}, paid_total = {PAID}, balance = {BILLED} - {PAID}, '
+        'carryover_total = (SELECT COALESCE(SUM(COALESCE(f.carryover_amount, 0)), 0) FROM final_invoices f '
+        'WHERE f.unit_id = unit_ledgers.unit_id), '
+        'invoice_count = (SELECT COUNT(*) FROM final_invoices f WHERE f.unit_id = unit_ledgers.unit_id), '
+        'updated_at = CURRENT_TIMESTAMP',
+        batch_size=500, key='unit_id')
+
+
+def downgrade():
+    op.drop_table('unit_ledgers')
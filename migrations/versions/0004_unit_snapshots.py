@@ -0,0 +1,99 @@
+"""unit snapshots
+
+세대 스냅샷을 내용 해시별로 한 번만 저장하는 unit_snapshots 와 상세 행의 참조 컬럼(unit_snapshot_id) 추가.
+기존 상세 행에 복사된 스냅샷 JSON 은 id 구간별로 해시해 모으고 참조 id 로 바꾼 뒤 JSON 컬럼은 비운다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 09:30:00.000000
+
+"""
+import hashlib
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import add_column_online, backfill_rows_in_batches, create_foreign_key_online, has_table
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+# (상세 테이블, 외래 키 이름)
+DETAIL_TABLES = (
+    ('electric_bill_details', 'fk_electric_details_snapshot'),
+    ('water_bill_details', 'fk_water_details_snapshot'),
+    ('common_bill_details', 'fk_common_details_snapshot'),
+)
+
+
+def snapshot_hash(snapshot):
+    # app.snapshot_hash 와 같은 해시 (이후 새 스냅샷과 같은 행을 공유하도록)
+    return hashlib.sha256(
+        json.dumps(snapshot, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    ).hexdigest()
+
+
+class SnapshotIds:
+    """내용 해시 → unit_snapshots.id (없으면 insert). 리비전 실행 동안 해시별로 한 번만 조회한다"""
+
+    def __init__(self):
+        self.ids = {}
+
+    def __call__(self, bind, row):
+        snapshot = row.unit_snapshot
+        if isinstance(snapshot, str):
+            snapshot = json.loads(snapshot)
+        snapshot_id = None
+        if snapshot:
+            content_hash = snapshot_hash(snapshot)
+            if content_hash not in self.ids:
+                self.ids[content_hash] = self._find(bind, content_hash) or self._insert(bind, content_hash, snapshot)
+            snapshot_id = self.ids[content_hash]
+        return {'unit_snapshot_id': snapshot_id, 'unit_snapshot': None}
+
+    @staticmethod
+    def _find(bind, content_hash):
+        return bind.execute(sa.text('SELECT id FROM unit_snapshots WHERE content_hash = :h'),
+                            {'h': content_hash}).scalar()
+
+    def _insert(self, bind, content_hash, snapshot):
+        bind.execute(sa.text('INSERT INTO unit_snapshots (content_hash, snapshot, created_at) '
+                             'VALUES (:h, :s, CURRENT_TIMESTAMP)').bindparams(sa.bindparam('s', type_=sa.JSON())),
+                     {'h': content_hash, 's': snapshot})
+        return self._find(bind, content_hash)
+
+
+def upgrade():
+    if not has_table('unit_snapshots'):
+        op.create_table('unit_snapshots',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('snapshot', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('content_hash')
+        )
+    for table, fk_name in DETAIL_TABLES:
+        if add_column_online(table, sa.Column('unit_snapshot_id', sa.Integer(), nullable=True)):
+            create_foreign_key_online(fk_name, table, ['unit_snapshot_id'], 'unit_snapshots', ['id'])
+
+    snapshot_ids = SnapshotIds()
+    for table, _ in DETAIL_TABLES:
+        backfill_rows_in_batches(table, ['unit_snapshot'], snapshot_ids,
+                                 {'unit_snapshot_id': sa.Integer(), 'unit_snapshot': sa.JSON(none_as_null=True)},
+                                 'unit_snapshot_id IS NULL AND unit_snapshot IS NOT NULL')
+
+
+def downgrade():
+    # 참조를 다시 JSON 으로 복사한 뒤 컬럼과 테이블을 제거
+    for table, fk_name in DETAIL_TABLES:
+        op.execute(f'UPDATE {table} SET unit_snapshot = (SELECT s.snapshot FROM unit_snapshots s '
+                   f'WHERE s.id = {table}.unit_snapshot_id) WHERE unit_snapshot_id IS NOT NULL')
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(fk_name, type_='foreignkey')
+            batch_op.drop_column('unit_snapshot_id')
+    op.drop_table('unit_snapshots')
@@ -0,0 +1,41 @@
+"""stale invoices
+
+참조 고지서가 재계산/삭제된 정산서 표시(is_stale)와 고지서 → 정산 항목 역참조 인덱스.
+POST /invoice/refresh/<id> 가 표시된 세대만 다시 계산한 뒤 표시를 끈다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 09:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import add_column_online, create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+ITEM_INDEXES = (
+    ('ix_invoice_combination_items_electric_bill_id', 'electric_bill_id'),
+    ('ix_invoice_combination_items_water_bill_id', 'water_bill_id'),
+    ('ix_invoice_combination_items_common_bill_id', 'common_bill_id'),
+)
+
+
+def upgrade():
+    for table in ('invoice_combinations', 'final_invoices'):
+        add_column_online(table, sa.Column('is_stale', sa.Boolean(), nullable=False, server_default=sa.false()))
+    for name, column in ITEM_INDEXES:
+        create_index_online(name, 'invoice_combination_items', (column,))
+
+
+def downgrade():
+    for name, _ in ITEM_INDEXES:
+        drop_index_online(name, 'invoice_combination_items')
+    for table in ('final_invoices', 'invoice_combinations'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('is_stale')
@@ -0,0 +1,35 @@
+"""web sessions
+
+서버 측 세션 저장소 (SESSION_BACKEND=database). 쿠키에는 서명된 세션 id 만 두고 데이터는 여기 저장한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 09:50:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import has_table
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if has_table('web_sessions'):
+        return
+    op.create_table('web_sessions',
+    sa.Column('id', sa.String(length=64), nullable=False),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_web_sessions_expires_at', 'web_sessions', ['expires_at'])
+
+
+def downgrade():
+    op.drop_table('web_sessions')
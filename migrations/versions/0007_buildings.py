@@ -0,0 +1,61 @@
+"""buildings
+
+다중 건물 지원: buildings 와 층/고지서/정산서/납부의 building_id. 기존 데이터는 모두 기본 건물(id 1)로 옮긴다.
+컬럼은 NULL 허용으로 추가해 id 구간별로 채우고, NOT NULL·외래 키·건물별 유니크 키는 0008 에서 적용한다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import add_column_online, backfill_in_batches, create_index_online, drop_index_online, has_table
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+DEFAULT_BUILDING_ID = 1
+SCOPED_TABLES = ('floors', 'electric_bills', 'water_bills', 'common_bills', 'invoice_combinations', 'payments')
+# 건물별 월/작성일 조회 인덱스 (층/수도요금은 0008 의 건물별 유니크 키가 대신한다)
+INDEXES = (
+    ('ix_electric_bills_building_month', 'electric_bills', ('building_id', 'billing_month')),
+    ('ix_common_bills_building_month', 'common_bills', ('building_id', 'billing_month')),
+    ('ix_invoice_combinations_building_created', 'invoice_combinations', ('building_id', 'created_at')),
+    ('ix_payments_building_date', 'payments', ('building_id', 'payment_date')),
+)
+
+
+def upgrade():
+    if not has_table('buildings'):
+        op.create_table('buildings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('address', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+    op.execute(sa.text('INSERT INTO buildings (id, name, created_at, updated_at) '
+                       'SELECT :id, :name, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP WHERE NOT EXISTS '
+                       '(SELECT 1 FROM buildings WHERE id = :id)').bindparams(id=DEFAULT_BUILDING_ID,
+                                                                              name='기본 건물'))
+    for table in SCOPED_TABLES:
+        add_column_online(table, sa.Column('building_id', sa.Integer(), nullable=True))
+        backfill_in_batches(table, 'building_id = :building_id', 'building_id IS NULL',
+                            params={'building_id': DEFAULT_BUILDING_ID})
+    for name, table, columns in INDEXES:
+        create_index_online(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        drop_index_online(name, table)
+    for table in reversed(SCOPED_TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('building_id')
+    op.drop_table('buildings')
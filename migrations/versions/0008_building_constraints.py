@@ -0,0 +1,44 @@
+"""building constraints
+
+0007 에서 채운 building_id 를 NOT NULL 로 바꾸고 buildings 외래 키를 건다.
+층 번호와 수도요금 월은 건물 안에서만 유일하도록 유니크 키를 (building_id, ...) 로 교체한다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19 10:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import create_foreign_key_online, replace_unique_online, set_not_null
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+SCOPED_TABLES = ('floors', 'electric_bills', 'water_bills', 'common_bills', 'invoice_combinations', 'payments')
+# (테이블, 기존 유니크 컬럼, 기존 이름 (0001), 새 유니크 키)
+UNIQUE_KEYS = (
+    ('floors', ('floor_number',), 'uq_floors_floor_number', 'uq_floors_building_number'),
+    ('water_bills', ('billing_month',), 'uq_water_bills_billing_month', 'uq_water_bills_building_month'),
+)
+
+
+def upgrade():
+    for table in SCOPED_TABLES:
+        set_not_null(table, 'building_id', sa.Integer())
+        create_foreign_key_online(f'fk_{table}_building', table, ['building_id'], 'buildings', ['id'])
+    for table, columns, _, name in UNIQUE_KEYS:
+        replace_unique_online(table, columns, name, ('building_id',) + columns)
+
+
+def downgrade():
+    for table, columns, old_name, name in UNIQUE_KEYS:
+        replace_unique_online(table, ('building_id',) + columns, old_name, columns)
+    for table in reversed(SCOPED_TABLES):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_constraint(f'fk_{table}_building', type_='foreignkey')
+            batch_op.alter_column('building_id', existing_type=sa.Integer(), nullable=True)
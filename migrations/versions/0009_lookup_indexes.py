@@ -0,0 +1,51 @@
+"""lookup indexes
+
+고지서·세대 / 정산서·세대 / 세대별 납부 조회 인덱스.
+이미 같은 컬럼 구성의 인덱스가 있으면 건너뛰고, 단일 컬럼 기존 인덱스는 복합 인덱스가 생긴 뒤에 제거한다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 13:40:12.000000
+
+"""
+from migration_ops import create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+# (이름, 테이블, 컬럼, 유니크, 대체되는 기존 인덱스 (SQLSchema.txt 로 만든 DB 의 이름))
+INDEXES = (
+    ('uq_electric_readings_bill_unit', 'electric_readings', ('electric_bill_id', 'unit_id'), True,
+     ('idx_electric_readings_bill',)),
+    ('uq_electric_details_bill_unit', 'electric_bill_details', ('electric_bill_id', 'unit_id'), True,
+     ('idx_electric_details_bill',)),
+    ('uq_water_details_bill_unit', 'water_bill_details', ('water_bill_id', 'unit_id'), True,
+     ('idx_water_details_bill',)),
+    ('uq_common_details_bill_unit', 'common_bill_details', ('common_bill_id', 'unit_id'), True,
+     ('idx_common_details_bill',)),
+    ('uq_final_invoices_comb_unit', 'final_invoices', ('combination_id', 'unit_id'), True,
+     ('idx_final_invoices_comb',)),
+    ('ix_final_invoices_unit_comb', 'final_invoices', ('unit_id', 'combination_id'), False,
+     ('idx_final_invoices_unit',)),
+    ('ix_payments_unit_comb_date', 'payments', ('unit_id', 'combination_id', 'payment_date'), False,
+     ('idx_payments_unit',)),
+    ('ix_payments_combination_id', 'payments', ('combination_id',), False, ()),
+)
+
+
+def upgrade():
+    for name, table, columns, unique, replaces in INDEXES:
+        create_index_online(name, table, columns, unique)
+        for old in replaces:
+            drop_index_online(old, table, optional=True)
+
+
+def downgrade():
+    # 외래 키가 쓰던 단일 컬럼 인덱스를 먼저 되돌린 뒤 복합 인덱스를 제거
+    for name, table, columns, unique, replaces in reversed(INDEXES):
+        if replaces:
+            create_index_online(replaces[0], table, columns[:1], skip_if_covered=False)
+        drop_index_online(name, table)
@@ -0,0 +1,62 @@
+"""monthly summaries
+
+대시보드용 월별 요약 테이블(monthly_summaries)과 정산서 대표 월(invoice_combinations.billing_month) 추가.
+기존 정산서의 대표 월은 항목 중 가장 늦은 청구월로, 항목이 없으면 작성월로 채운다.
+요약 행은 bootstrap_database 가 비어 있는 테이블을 보고 원본 테이블로 재구성한다 (flask --app wsgi rebuild-summary).
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 15:02:37.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_ops import add_column_online, backfill_in_batches, create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_column_online('invoice_combinations', sa.Column('billing_month', sa.Date(), nullable=True))
+    backfill_in_batches(
+        'invoice_combinations',
+        'billing_month = (SELECT MAX(i.billing_month) FROM invoice_combination_items i '
+        'WHERE i.combination_id = invoice_combinations.id)',
+        'billing_month IS NULL')
+    if not op.get_context().as_sql:
+        # 항목이 없는 정산서: 작성월 1일 (날짜 함수가 DB 마다 달라 파이썬에서 계산)
+        combinations = sa.table('invoice_combinations', sa.column('id', sa.Integer()),
+                                sa.column('created_at', sa.DateTime()), sa.column('billing_month', sa.Date()))
+        bind = op.get_bind()
+        rows = bind.execute(sa.select(combinations.c.id, combinations.c.created_at).where(
+            combinations.c.billing_month.is_(None), combinations.c.created_at.is_not(None))).all()
+        for combination_id, created_at in rows:
+            bind.execute(combinations.update().where(combinations.c.id == combination_id).values(
+                billing_month=created_at.date().replace(day=1)))
+    else:
+        op.execute('-- 항목이 없는 정산서(billing_month IS NULL)는 작성월 1일로 채울 것')
+    create_index_online('ix_invoice_combinations_building_month', 'invoice_combinations',
+                        ('building_id', 'billing_month'))
+
+    op.create_table('monthly_summaries',
+    sa.Column('building_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('category', sa.String(length=20), nullable=False),
+    sa.Column('floor_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('amount', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('row_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('building_id', 'month', 'category', 'floor_id')
+    )
+
+
+def downgrade():
+    op.drop_table('monthly_summaries')
+    drop_index_online('ix_invoice_combinations_building_month', 'invoice_combinations')
+    with op.batch_alter_table('invoice_combinations') as batch_op:
+        batch_op.drop_column('billing_month')
@@ -0,0 +1,39 @@
+"""payment scope indexes
+
+납부 조회 인덱스에 building_id 를 두 번째 컬럼으로 추가한다 (세대별 인덱스는 납부일 정렬까지 인덱스로 처리). 건물 범위 조건이 붙은 세대/정산서별 납부 조회에서
+통계가 없는 SQLite 가 건물 조건만 맞는 ix_payments_building_date 를 골라 건물 전체를 읽던 문제를 막는다.
+새 인덱스도 unit_id / combination_id 로 시작하므로 외래 키 인덱스 역할은 그대로 유지된다.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18 16:20:05.000000
+
+"""
+from migration_ops import create_index_online, drop_index_online
+
+# revision identifiers, used by Alembic.
+revision = '0011'
+down_revision = '0010'
+branch_labels = None
+depends_on = None
+
+# (새 인덱스, 컬럼, 대체되는 인덱스 (앞쪽이 0009 이름, 뒤쪽은 SQLSchema.txt 로 만든 DB 의 이름), 되돌릴 컬럼)
+INDEXES = (
+    ('ix_payments_unit_building_date', ('unit_id', 'building_id', 'payment_date'),
+     ('ix_payments_unit_comb_date',), ('unit_id', 'combination_id', 'payment_date')),
+    ('ix_payments_comb_building', ('combination_id', 'building_id'),
+     ('ix_payments_combination_id', 'idx_payments_combination'), ('combination_id',)),
+)
+
+
+def upgrade():
+    for name, columns, replaces, _ in INDEXES:
+        create_index_online(name, 'payments', columns)
+        for old in replaces:
+            drop_index_online(old, 'payments', optional=True)
+
+
+def downgrade():
+    for name, _, replaces, old_columns in reversed(INDEXES):
+        create_index_online(replaces[0], 'payments', old_columns, skip_if_covered=False)
+        drop_index_online(name, 'payments')
@@ -0,0 +1,111 @@
+"""앱 테스트 공통 fixture: 메모리 SQLite 위에서 앱을 한 번 초기화하고 테스트마다 스키마를 새로 만든다."""
+import pytest
+from sqlalchemy import event
+
+import app as bill_app
+
+
+@pytest.fixture(scope='session')
+def flask_app(tmp_path_factory):
+    return bill_app.create_app({
+        'DATABASE_URL': 'sqlite://',
+        'SECRET_KEY': 'test',
+        'TESTING': True,
+        'PRINT_CACHE_DIR': str(tmp_path_factory.mktemp('print_cache')),
+    })
+
+
+@pytest.fixture
+def db(flask_app):
+    with flask_app.app_context():
+        bill_app.db.drop_all()
+        bill_app.db.create_all()
+        bill_app.invalidate_settings_cache()
+        bill_app.db.session.add(bill_app.Building(id=bill_app.DEFAULT_BUILDING_ID, name='기본 건물'))
+        for key, value in {'tv_fee': '2500', 'electric_welfare_amount': '1000', 'electric_voucher_amount': '0',
+                           'water_welfare_amount': '500', 'invoice_default_memo': '',
+                           'invoice_footer': 'footer'}.items():
+            bill_app.db.session.add(bill_app.Setting(setting_key=key, setting_value=value))
+        bill_app.db.session.commit()
+        yield bill_app.db
+        bill_app.db.session.remove()
+
+
+@pytest.fixture
+def client(flask_app, db):
+    client = flask_app.test_client()
+    with client.session_transaction() as session:
+        session['_csrf_token'] = 'tok'
+    return client
+
+
+def seed_units(floors=2, units_per_floor=3, first_floor=1):
+    """층/세대 등록. 세대 이름은 '{층}0{번호}', 거주 인원은 번호와 같다"""
+    session = bill_app.db.session
+    for number in range(first_floor, first_floor + floors):
+        floor = bill_app.Floor(floor_number=number, name=f'{number}층')
+        session.add(floor)
+        session.flush()
+        for i in range(1, units_per_floor + 1):
+            session.add(bill_app.Unit(floor_id=floor.id, unit_name=f'{number}0{i}', residents_count=i,
+                                      electric_welfare=(i == 1), has_tv=(i != 3)))
+    session.commit()
+    return bill_app.Floor.query.filter(bill_app.Floor.floor_number >= first_floor).order_by(
+        bill_app.Floor.floor_number).all()
+
+
+def post(client, url, form=None, json=None):
+    """CSRF 토큰을 붙여 POST 하고 JSON 응답을 돌려준다"""
+    if json is not None:
+        return client.post(url, json={'_csrf_token': 'tok', **json}).get_json()
+    return client.post(url, data={'_csrf_token': 'tok', **(form or {})}).get_json()
+
+
+def calculate_month(client, floors, month):
+    """층별 전기요금, 수도요금, 공동 공과금을 계산하고 정산서 항목 목록을 돌려준다"""
+    items = []
+    for floor in floors:
+        form = {'billing_month': month, 'floor_id': floor.id, 'month_count': '1', 'month_0': month,
+                'amount_0': '50000', 'welfare_0': '0', 'voucher_0': '0', 'tv_fee_0': '2500'}
+        for unit in floor.units:
+            form[f'prev_{unit.id}'] = '100'
+            form[f'curr_{unit.id}'] = str(150 + unit.id)
+        assert post(client, '/calculate/electric', form)['success']
+    assert post(client, '/calculate/water', {'billing_month': month, 'total_amount': '30000'})['success']
+    assert post(client, '/calculate/common', {'billing_month': month, 'total_amount': '9990',
+                                              'description': '청소'})['success']
+
+    first_day = f'{month}-01'
+    items += [{'type': 'ELECTRIC', 'id': b.id, 'month': first_day}
+              for b in bill_app.ElectricBill.query.filter(bill_app.ElectricBill.billing_month == first_day)]
+    items += [{'type': 'WATER', 'id': b.id, 'month': first_day}
+              for b in bill_app.WaterBill.query.filter(bill_app.WaterBill.billing_month == first_day)]
+    items += [{'type': 'COMMON', 'id': b.id, 'month': first_day, 'description': b.description}
+              for b in bill_app.CommonBill.query.filter(bill_app.CommonBill.billing_month == first_day)]
+    return items
+
+
+class QueryCounter:
+    """블록 안에서 실행된 SQL 문 (before_cursor_execute 기준). executions: (문장, 파라미터, executemany 여부)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.executions = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.executions.append((statement, parameters, executemany))
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    @property
+    def statements(self):
+        return [statement for statement, _, _ in self.executions]
+
+    @property
+    def count(self):
+        return len(self.executions)
@@ -0,0 +1,92 @@
+"""allocation 모듈 배분 결과 고정 (DB 없이 실행). 기대값은 모듈 분리 전 라우트 계산 결과와 같다."""
+from decimal import Decimal
+from fractions import Fraction
+
+from allocation import allocate_common, allocate_electric, allocate_electric_batch, allocate_water, round_up_to_10
+
+
+def charged(result):
+    return [d['charged_amount'] for d in result['details']]
+
+
+def electric_units():
+    return [
+        {'unit_id': 1, 'previous_reading': 100, 'current_reading': 250,
+         'electric_welfare': True, 'electric_voucher': False, 'has_tv': True},
+        {'unit_id': 2, 'previous_reading': 200, 'current_reading': 270,
+         'electric_welfare': False, 'electric_voucher': True, 'has_tv': True},
+        {'unit_id': 3, 'previous_reading': 50, 'current_reading': 90,
+         'electric_welfare': False, 'electric_voucher': False, 'has_tv': False},
+    ]
+
+
+def test_round_up_to_10_is_exact():
+    assert round_up_to_10(Fraction(36000, 6)) == 6000
+    assert round_up_to_10(Fraction(60001, 10)) == 6010
+    assert round_up_to_10(Decimal('6000.01')) == 6010
+    assert round_up_to_10(Decimal('5990.00')) == 5990
+    assert round_up_to_10(0) == 0
+
+
+def test_electric_batch_matches_single_floor_allocation():
+    floors = [
+        {'units': electric_units(), 'total_amount': 87650, 'tv_fee': 2500, 'month_count': 2,
+         'welfare_setting': 4000, 'voucher_setting': 1500},
+        {'units': electric_units()[1:], 'total_amount': 60000, 'tv_fee_total': 7500,
+         'tv_distribution_mode': 'EQUAL', 'welfare_input': 3000},
+    ]
+    results = allocate_electric_batch(floors)
+    assert [charged(r) for r in results] == [charged(allocate_electric(**f)) for f in floors]
+    assert charged(results[0]) == [53920, 28560, 15180]
+
+
+def test_electric_by_usage_with_setting_discounts_and_tv():
+    result = allocate_electric(electric_units(), 87650, tv_fee=2500, month_count=2,
+                               welfare_setting=4000, voucher_setting=1500)
+    assert charged(result) == [53920, 28560, 15180]
+    assert [d['usage_amount'] for d in result['details']] == [150, 70, 40]
+    assert [d['tv_fee'] for d in result['details']] == [5000, 5000, 0]
+    assert result['welfare_discount'] == 8000
+    assert result['voucher_discount'] == 3000
+
+
+def test_electric_equal_tv_and_input_welfare():
+    result = allocate_electric(electric_units(), 60000, tv_fee_total=7500, tv_distribution_mode='EQUAL',
+                               welfare_input=3000)
+    assert charged(result) == [35850, 19470, 12200]
+    assert result['welfare_discount'] == 3000
+
+
+def test_electric_without_usage_splits_equally():
+    units = [dict(u, current_reading=u['previous_reading']) for u in electric_units()]
+    assert charged(allocate_electric(units, 30000)) == [10000, 10000, 10000]
+
+
+def test_water_by_residents():
+    units = [{'unit_id': i, 'residents_count': r, 'water_welfare': False} for i, r in enumerate([1, 2, 3])]
+    assert charged(allocate_water(units, 180)) == [30, 60, 90]
+
+
+def test_water_excluded_unit_and_welfare_setting():
+    units = [
+        {'unit_id': 1, 'residents_count': 2, 'water_welfare': True},
+        {'unit_id': 2, 'residents_count': 1, 'water_welfare': False},
+        {'unit_id': 3, 'residents_count': 3, 'water_welfare': True},
+    ]
+    result = allocate_water(units, 30000, welfare_setting=1000, excluded_unit_ids={3})
+    assert charged(result) == [19670, 10340, 0]
+    assert [d['is_excluded'] for d in result['details']] == [False, False, True]
+    assert result['welfare_discount_total'] == 1000
+
+
+def test_common_by_residents():
+    units = [{'unit_id': i, 'residents_count': 1} for i in range(6)]
+    assert charged(allocate_common(units, 36000)) == [6000] * 6
+
+    units = [{'unit_id': i, 'residents_count': r} for i, r in enumerate([1, 2, 4])]
+    assert charged(allocate_common(units, 10000)) == [1430, 2860, 5720]
+
+
+def test_common_by_units():
+    units = [{'unit_id': i, 'residents_count': r} for i, r in enumerate([1, 2, 4])]
+    assert charged(allocate_common(units, 10000, 'BY_UNITS')) == [3340, 3340, 3340]
@@ -0,0 +1,80 @@
+"""고지서 덮어쓰기: 바뀐 세대 행만 고치는 증분 갱신(apply_row_diff) 결과가 전체 재작성과 같은지 확인"""
+import app as bill_app
+from conftest import post, seed_units
+
+
+def electric_form(floor, units, amount, readings, **extra):
+    form = {'billing_month': '2024-01', 'floor_id': floor.id, 'month_count': '1', 'month_0': '2024-01',
+            'amount_0': amount, 'welfare_0': '0', 'voucher_0': '0', 'tv_fee_0': '2500', **extra}
+    for unit in units:
+        form[f'prev_{unit.id}'] = '100'
+        form[f'curr_{unit.id}'] = str(readings[unit.id])
+    return form
+
+
+def electric_rows(floor):
+    """세대별 (검침, 비교 기준 컬럼). base/final 은 증분 갱신에서 바뀌지 않은 행을 쓰지 않으므로 제외"""
+    bill = bill_app.ElectricBill.query.filter_by(floor_id=floor.id).one()
+    readings = {r.unit_id: (r.previous_reading, r.current_reading)
+                for r in bill_app.ElectricReading.query.filter_by(electric_bill_id=bill.id)}
+    return bill.id, {d.unit_id: (readings.get(d.unit_id),
+                                 tuple(getattr(d, c) for c in bill_app.ELECTRIC_DETAIL_DIFF_COLS))
+                     for d in bill_app.ElectricBillDetail.query.filter_by(electric_bill_id=bill.id)}
+
+
+def test_electric_overwrite_diff_matches_rebuild(client):
+    floor = seed_units(floors=1, units_per_floor=4)[0]
+    units = sorted(floor.units, key=lambda u: u.id)
+    readings = {u.id: 150 + 10 * u.id for u in units}
+    assert post(client, '/calculate/electric', electric_form(floor, units, '60000', readings))['success']
+    bill_id, _ = electric_rows(floor)
+
+    # 세대 하나는 검침 변경, 하나는 공실 처리(행 삭제), 새 세대 하나 추가(행 추가)
+    changed, removed = units[0], units[1]
+    readings[changed.id] += 40
+    removed.is_vacant = True
+    added = bill_app.Unit(floor_id=floor.id, unit_name='105', residents_count=2, has_tv=True)
+    bill_app.db.session.add(added)
+    bill_app.db.session.commit()
+    readings[added.id] = 180
+    occupied = [u for u in units if u is not removed] + [added]
+
+    result = post(client, '/calculate/electric', electric_form(floor, occupied, '60000', readings, overwrite='true'))
+    assert result['success']
+    assert (result['inserted'], result['deleted']) == (1, 1) and result['updated'] >= 1
+    incremental_id, incremental = electric_rows(floor)
+    assert incremental_id == bill_id
+    assert set(incremental) == {u.id for u in occupied}
+
+    form = electric_form(floor, occupied, '60000', readings, overwrite='true', rebuild='true')
+    assert post(client, '/calculate/electric', form)['success']
+    _, rebuilt = electric_rows(floor)
+    assert incremental == rebuilt
+
+
+def water_rows():
+    bill = bill_app.WaterBill.query.one()
+    return {d.unit_id: tuple(getattr(d, c) for c in bill_app.WATER_DETAIL_DIFF_COLS)
+            for d in bill_app.WaterBillDetail.query.filter_by(water_bill_id=bill.id)}
+
+
+def test_water_overwrite_diff_matches_rebuild(client):
+    floor = seed_units(floors=2, units_per_floor=3)[0]
+    form = {'billing_month': '2024-01', 'total_amount': '31000', 'excluded_units': '[]'}
+    assert post(client, '/calculate/water', form)['success']
+
+    # 인원 변경, 공실 처리, 세대 추가, 제외 세대 지정
+    units = sorted(floor.units, key=lambda u: u.id)
+    units[0].residents_count = 5
+    units[1].is_vacant = True
+    bill_app.db.session.add(bill_app.Unit(floor_id=floor.id, unit_name='104', residents_count=2))
+    bill_app.db.session.commit()
+    form['excluded_units'] = f'[{units[2].id}]'
+
+    result = post(client, '/calculate/water', dict(form, overwrite='true'))
+    assert result['success']
+    assert (result['inserted'], result['deleted']) == (1, 1) and result['updated'] >= 2
+    incremental = water_rows()
+
+    assert post(client, '/calculate/water', dict(form, overwrite='true', rebuild='true'))['success']
+    assert incremental == water_rows()
@@ -0,0 +1,38 @@
+"""create_app 싱글턴: 한 번 초기화한 뒤에는 같은 앱을 돌려주고 설정 변경은 거부한다. 기동 시 누락 인덱스는 경고만 남긴다"""
+import os
+import subprocess
+import sys
+
+import pytest
+from sqlalchemy import create_engine, text
+
+import app as bill_app
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_create_app_returns_configured_singleton(flask_app):
+    assert bill_app.create_app() is flask_app
+    assert flask_app.config['SQLALCHEMY_DATABASE_URI'] == 'sqlite://'
+
+
+def test_create_app_rejects_overrides_after_initialisation(flask_app):
+    with pytest.raises(RuntimeError, match='DATABASE_URL'):
+        bill_app.create_app({'DATABASE_URL': 'sqlite:////tmp/other.db'})
+    assert flask_app.config['SQLALCHEMY_DATABASE_URI'] == 'sqlite://'
+
+
+def test_create_app_warns_about_missing_indexes_without_exiting(tmp_path):
+    db_path = tmp_path / 'app.db'
+    engine = create_engine(f'sqlite:///{db_path}')
+    bill_app.db.metadata.create_all(engine)
+    index = next(iter(bill_app.Payment.__table__.indexes))
+    with engine.begin() as conn:
+        conn.execute(text(f'DROP INDEX {index.name}'))
+    engine.dispose()
+
+    code = f"import app; app.create_app({{'DATABASE_URL': 'sqlite:///{db_path}'}}); print('started')"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert 'started' in result.stdout
+    assert f'누락된 INDEX {index.name} ON payments' in result.stderr
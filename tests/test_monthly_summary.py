@@ -0,0 +1,111 @@
+"""월별 요약 롤업: 쓰기 경로마다 갱신한 결과가 원본 테이블로 재구성한 결과와 같은지 확인"""
+import app as bill_app
+from conftest import post, seed_units
+
+
+def summary_rows():
+    return sorted((r.building_id, r.month, r.category, r.floor_id, r.amount, r.row_count)
+                  for r in bill_app.MonthlySummary.query.all())
+
+
+def assert_matches_rebuild():
+    live = summary_rows()
+    bill_app.rebuild_monthly_summaries()
+    bill_app.db.session.commit()
+    assert live == summary_rows()
+    return live
+
+
+def electric_form(floor, month, amount='50000', curr_offset=150, **extra):
+    form = {'billing_month': month, 'floor_id': floor.id, 'month_count': '1', 'month_0': month,
+            'amount_0': amount, 'welfare_0': '0', 'voucher_0': '0', 'tv_fee_0': '2500', **extra}
+    for unit in floor.units:
+        form[f'prev_{unit.id}'] = '100'
+        form[f'curr_{unit.id}'] = str(curr_offset + unit.id)
+    return form
+
+
+def create_invoice(client, month):
+    items = [{'type': item_type, 'id': b.id, 'month': f'{month}-01'}
+             for item_type, bill in bill_app.BILL_SOURCES.items()
+             for b in bill.query.filter(bill.billing_month == f'{month}-01')]
+    result = post(client, '/invoice/create', json={'name': month, 'items': items})
+    assert result['success']
+    return result['id']
+
+
+def test_bill_write_paths_keep_rollup_in_sync(client):
+    floors = seed_units()
+    for floor in floors:
+        assert post(client, '/calculate/electric', electric_form(floor, '2024-01'))['success']
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '30000'})['success']
+    assert post(client, '/calculate/common', {'billing_month': '2024-01', 'total_amount': '9990',
+                                              'description': '청소'})['success']
+    assert {r[2] for r in assert_matches_rebuild()} == {'ELECTRIC', 'WATER', 'COMMON'}
+
+    # 증분 재계산, 전체 재작성, 여러 층 일괄 계산, 삭제
+    assert post(client, '/calculate/electric', electric_form(floors[0], '2024-01', '70000', overwrite='true'))[
+        'success']
+    assert_matches_rebuild()
+    assert post(client, '/calculate/electric', electric_form(floors[1], '2024-01', '60000', 300,
+                                                             overwrite='true', rebuild='true'))['success']
+    assert_matches_rebuild()
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '40000',
+                                             'overwrite': 'true'})['success']
+    assert_matches_rebuild()
+    batch = [{'floor_id': f.id, 'months': [{'month': '2024-02', 'amount': '40000'}],
+              'readings': {str(u.id): {'prev': 300, 'curr': 350} for u in f.units}} for f in floors]
+    assert post(client, '/calculate/electric/batch', json={'billing_month': '2024-02', 'floors': batch})['success']
+    assert_matches_rebuild()
+    water = bill_app.WaterBill.query.one()
+    assert post(client, f'/bills/delete/water/{water.id}', json={})['success']
+    assert 'WATER' not in {r[2] for r in assert_matches_rebuild()}
+
+
+def test_invoice_and_payment_write_paths_keep_rollup_in_sync(client):
+    seed_units()
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '30000'})['success']
+    combination_id = create_invoice(client, '2024-01')
+    assert 'BILLED' in {r[2] for r in assert_matches_rebuild()}
+
+    unit_id = bill_app.Unit.query.first().id
+    payment = {'combination_id': combination_id, 'unit_id': unit_id,
+               'payment_date': '2024-02-05', 'payment_amount': '1000'}
+    assert post(client, '/payments/add', json=payment)['success']
+    assert_matches_rebuild()
+    payment_id = bill_app.Payment.query.one().id
+    # 납부일이 다른 달로 바뀌면 이전 달과 새 달 모두 다시 집계
+    assert post(client, f'/payments/update/{payment_id}', json=dict(payment, payment_date='2024-03-05',
+                                                                    payment_amount='700'))['success']
+    paid_months = {r[1].isoformat() for r in assert_matches_rebuild() if r[2] == 'PAID'}
+    assert paid_months == {'2024-03-01'}
+    assert post(client, '/payments/import/commit', json={'rows': [
+        dict(payment, payment_date='2024-04-01'), dict(payment, payment_date='2024-04-20')]})['success']
+    assert_matches_rebuild()
+
+    # stale 정산서 갱신
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '45000',
+                                             'overwrite': 'true'})['success']
+    assert post(client, f'/invoice/refresh/{combination_id}', json={})['success']
+    assert_matches_rebuild()
+
+    assert post(client, f'/payments/delete/{payment_id}', json={})['success']
+    assert_matches_rebuild()
+    assert post(client, f'/invoice/delete/{combination_id}', json={})['success']
+    assert assert_matches_rebuild() == [r for r in summary_rows() if r[2] == 'WATER']
+
+
+def test_dashboard_outstanding_matches_ledger(client):
+    seed_units()
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '30000'})['success']
+    combination_id = create_invoice(client, '2024-01')
+    assert post(client, '/payments/add', json={'combination_id': combination_id,
+                                                'unit_id': bill_app.Unit.query.first().id,
+                                                'payment_date': '2024-02-05', 'payment_amount': '5000'})['success']
+
+    with bill_app.app.test_request_context('/'):
+        dashboard = bill_app.monthly_dashboard()
+    ledger_balance = sum(l.balance for l in bill_app.UnitLedger.query.all())
+    assert [m['month'].isoformat() for m in dashboard['months']] == ['2024-02-01', '2024-01-01']
+    assert dashboard['months'][0]['outstanding'] == ledger_balance
+    assert client.get('/').status_code == 200
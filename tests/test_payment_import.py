@@ -0,0 +1,60 @@
+"""은행 CSV 입금 매칭: 중복 판정과 미납 정산서 조회"""
+from datetime import date
+
+import app as bill_app
+from conftest import post, seed_units
+
+PAID_ON = date(2024, 2, 5)
+
+
+def water_invoice(client):
+    """세대 이름별 청구액. 101 과 201 은 거주 인원이 같아 청구액도 같다"""
+    seed_units()
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '12000'})['success']
+    bill = bill_app.WaterBill.query.one()
+    result = post(client, '/invoice/create', json={
+        'name': '1월', 'items': [{'type': 'WATER', 'id': bill.id, 'month': '2024-01-01'}]})
+    assert result['success']
+    units = {u.unit_name: u for u in bill_app.Unit.query.all()}
+    totals = {name: bill_app.FinalInvoice.query.filter_by(unit_id=u.id).one().total_amount
+              for name, u in units.items()}
+    return result['id'], units, totals
+
+
+def deposit(memo, amount, line=1):
+    return {'line': line, 'payment_date': PAID_ON, 'payment_amount': amount, 'memo': memo}
+
+
+def test_same_amount_payment_of_another_unit_is_not_duplicate(client):
+    combination_id, units, totals = water_invoice(client)
+    amount = totals['101']
+    assert amount == totals['201']
+    assert post(client, '/payments/add', json={
+        'combination_id': combination_id, 'unit_id': units['101'].id,
+        'payment_date': PAID_ON.isoformat(), 'payment_amount': str(amount)})['success']
+
+    open_items, all_units = bill_app.open_invoice_items(), bill_app.Unit.query.all()
+    rows = bill_app.match_bank_deposits([deposit('101호', amount, 1), deposit('201호 김철수', amount, 2)],
+                                        open_items, all_units)
+    assert rows[0]['status'] == 'duplicate' and rows[0]['unit_id'] == units['101'].id
+    assert rows[1]['status'] == 'matched' and rows[1]['unit_id'] == units['201'].id
+
+    # 세대를 특정할 수 없는 입금은 건너뛰지 않고 후보와 함께 확인 대상으로 남긴다
+    [row] = bill_app.match_bank_deposits([deposit('김철수', amount)], open_items, all_units)
+    assert row['status'] == 'ambiguous' and row['possible_duplicate']
+    assert row['unit_id'] == units['201'].id
+
+
+def test_open_invoice_items_excludes_paid_invoices(client):
+    combination_id, units, totals = water_invoice(client)
+    post(client, '/payments/add', json={
+        'combination_id': combination_id, 'unit_id': units['101'].id,
+        'payment_date': PAID_ON.isoformat(), 'payment_amount': str(totals['101'])})
+    post(client, '/payments/add', json={
+        'combination_id': combination_id, 'unit_id': units['102'].id,
+        'payment_date': PAID_ON.isoformat(), 'payment_amount': '100'})
+
+    items = {i['unit_id']: i['outstanding'] for i in bill_app.open_invoice_items()}
+    assert units['101'].id not in items
+    assert items[units['102'].id] == totals['102'] - 100
+    assert len(items) == len(units) - 1
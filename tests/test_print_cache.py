@@ -0,0 +1,39 @@
+"""인쇄본 파일 캐시: 인쇄되는 세대/층 이름이 바뀌면 이전 파일을 다시 쓰지 않는지 확인"""
+import glob
+import os
+
+import app as bill_app
+from conftest import calculate_month, post, seed_units
+
+
+def print_html(client, combination_id):
+    response = client.get(f'/invoice/print/{combination_id}')
+    assert response.status_code == 200
+    return response.get_data(as_text=True)
+
+
+def cached_files(combination_id):
+    return glob.glob(os.path.join(bill_app.app.config['PRINT_CACHE_DIR'], f'{combination_id}-*.html'))
+
+
+def test_print_cache_follows_unit_and_floor_renames(client):
+    floor = seed_units(floors=1, units_per_floor=2)[0]
+    result = post(client, '/invoice/create', json={'name': '1월', 'items': calculate_month(client, [floor], '2024-01')})
+    assert result['success']
+    combination_id = result['id']
+
+    html = print_html(client, combination_id)
+    assert '청구서-101' in html and '1층' in html
+    assert len(cached_files(combination_id)) == 1
+    assert print_html(client, combination_id) == html
+
+    unit = floor.units[0]
+    assert post(client, f'/units/{unit.id}/update', {
+        'unit_name': '101호', 'residents_count': unit.residents_count,
+        'electric_welfare': 'true' if unit.electric_welfare else 'false',
+        'has_tv': 'true' if unit.has_tv else 'false'})['success']
+    assert post(client, f'/floors/{floor.id}/update', {'name': '일층'})['success']
+
+    html = print_html(client, combination_id)
+    assert '청구서-101호' in html and '일층' in html and '1층' not in html
+    assert len(cached_files(combination_id)) == 1
@@ -0,0 +1,21 @@
+"""정산서 생성의 SQL 문 수가 세대·항목 수와 무관한지 확인 (N+1 회귀 방지)"""
+import app as bill_app
+from conftest import QueryCounter, calculate_month, post, seed_units
+
+
+def create_invoice_statements(client, db, items):
+    with QueryCounter(db.engine) as counter:
+        assert post(client, '/invoice/create', json={'name': 'test', 'items': items})['success']
+    return counter.count
+
+
+def test_create_invoice_query_count_is_independent_of_units_and_items(client, db):
+    small_items = calculate_month(client, seed_units(floors=1, units_per_floor=2), '2024-01')
+    small = create_invoice_statements(client, db, small_items)
+
+    seed_units(floors=3, units_per_floor=5, first_floor=2)
+    large_items = calculate_month(client, bill_app.Floor.query.all(), '2024-02') + small_items
+    assert len(large_items) == len(small_items) + 6 and bill_app.Unit.query.count() == 17
+    large = create_invoice_statements(client, db, large_items)
+
+    assert large == small
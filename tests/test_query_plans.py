@@ -0,0 +1,119 @@
+"""조회 경로가 인덱스를 타는지 확인 (SQLite EXPLAIN QUERY PLAN)
+
+앱 함수/라우트를 실제로 실행해 나간 SELECT 문을 그대로(같은 파라미터로) EXPLAIN 하고,
+모델에 선언한 조회 인덱스가 있는 테이블을 전체 스캔하면 실패한다.
+"""
+import re
+from datetime import date
+
+import pytest
+
+import app as bill_app
+from conftest import QueryCounter, post, seed_units
+
+# 세대/고지서/정산서 기준 조회 인덱스가 있는 테이블
+INDEXED_TABLES = {'electric_readings', 'electric_bill_details', 'water_bill_details', 'common_bill_details',
+                  'final_invoices', 'payments'}
+
+
+def is_full_scan(detail):
+    """SCAN 이거나, 건물 조건(building_id)만으로 찾는 SEARCH 면 전체 스캔으로 본다 (건물 하나면 같은 비용)"""
+    if detail.startswith('SCAN'):
+        return True
+    m = re.search(r'USING (?:COVERING )?INDEX \w+ \((.*)\)', detail)
+    return bool(m) and {c.split('=')[0].split('>')[0].split('<')[0].strip()
+                        for c in m.group(1).split(' AND ')} <= {'building_id'}
+
+
+def full_scans(engine, executions):
+    """(테이블, 계획 설명, 문장) 목록: INDEXED_TABLES 를 전체 스캔한 SELECT 문"""
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters, executemany in executions:
+            if executemany or not statement.lstrip().upper().startswith('SELECT'):
+                continue
+            for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters):
+                m = re.match(r'(?:SCAN|SEARCH) (?:TABLE )?(\w+)', row[3])
+                if m and m.group(1) in INDEXED_TABLES and is_full_scan(row[3]):
+                    scans.append((m.group(1), row[3], statement))
+    return scans
+
+
+@pytest.fixture
+def history(client):
+    """2개월치 전기/수도/공동 고지서, 월별 정산서, 납부가 있는 건물"""
+    floors = seed_units(floors=3, units_per_floor=4)
+    combination_ids = []
+    for month in ('2024-01', '2024-02'):
+        for floor in floors:
+            form = {'billing_month': month, 'floor_id': floor.id, 'month_count': '1', 'month_0': month,
+                    'amount_0': '50000', 'welfare_0': '0', 'voucher_0': '0', 'tv_fee_0': '2500'}
+            for unit in floor.units:
+                form[f'prev_{unit.id}'] = '100'
+                form[f'curr_{unit.id}'] = str(150 + unit.id)
+            assert post(client, '/calculate/electric', form)['success']
+        assert post(client, '/calculate/water', {'billing_month': month, 'total_amount': '30000'})['success']
+        assert post(client, '/calculate/common', {'billing_month': month, 'total_amount': '9990',
+                                                  'description': '청소'})['success']
+        items = month_items(date.fromisoformat(f'{month}-01'))
+        result = post(client, '/invoice/create', json={'name': month, 'items': items})
+        assert result['success']
+        combination_ids.append(result['id'])
+        for unit in bill_app.Unit.query.limit(6):
+            assert post(client, '/payments/add', json={
+                'combination_id': result['id'], 'unit_id': unit.id,
+                'payment_date': f'{month}-25', 'payment_amount': '10000'})['success']
+    return {'combination_ids': combination_ids, 'items': items,
+            'unit_ids': [u.id for u in bill_app.Unit.query.order_by(bill_app.Unit.id)]}
+
+
+def month_items(month):
+    items = []
+    for item_type, bill in bill_app.BILL_SOURCES.items():
+        for b in bill.query.filter(bill.billing_month == month):
+            items.append({'type': item_type, 'id': b.id, 'month': month.isoformat(),
+                          'description': getattr(b, 'description', None)})
+    return items
+
+
+def capture(db, func, *args):
+    with QueryCounter(db.engine) as counter:
+        func(*args)
+    assert counter.executions
+    return counter.executions
+
+
+def assert_indexed(db, executions):
+    scans = full_scans(db.engine, executions)
+    assert not scans, '\n'.join(f'{table}: {detail}\n  {sql}' for table, detail, sql in scans)
+
+
+def test_load_charged_amounts_uses_indexes(db, history):
+    assert_indexed(db, capture(db, bill_app.load_charged_amounts, history['items']))
+
+
+def test_compute_unit_balances_uses_indexes(db, history):
+    assert_indexed(db, capture(db, bill_app.compute_unit_balances, history['unit_ids'][:3]))
+
+
+def test_combination_ledger_deltas_uses_indexes(db, history):
+    assert_indexed(db, capture(db, bill_app.combination_ledger_deltas, history['combination_ids'][-1]))
+
+
+def test_stale_invoices_for_uses_indexes(db, history):
+    bill = bill_app.WaterBill.query.order_by(bill_app.WaterBill.id.desc()).first()
+    assert_indexed(db, capture(db, bill_app.stale_invoices_for, 'WATER', bill.id, history['unit_ids'][:3]))
+
+
+def test_payment_unit_history_uses_indexes(client, db, history):
+    def fetch(unit_id):
+        assert client.get(f'/payments/unit_history/{unit_id}').get_json()['success']
+
+    assert_indexed(db, capture(db, fetch, history['unit_ids'][0]))
+
+
+def test_delete_invoice_uses_indexes(client, db, history):
+    def delete(combination_id):
+        assert post(client, f'/invoice/delete/{combination_id}', json={})['success']
+
+    assert_indexed(db, capture(db, delete, history['combination_ids'][0]))
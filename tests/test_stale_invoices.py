@@ -0,0 +1,74 @@
+"""정산서가 참조하는 고지서를 다시 계산하면 stale 로 표시되고, 갱신 결과가 새로 만든 정산서와 같은지 확인"""
+import app as bill_app
+from conftest import calculate_month, post, seed_units
+
+ADDITIONAL = {'charges': [{'description': '수선비', 'amount': 1000}, {'description': '전월 미납', 'amount': 2500}]}
+
+
+def create_invoice(client, items, unit):
+    result = post(client, '/invoice/create', json={'name': 'test', 'items': items,
+                                                   'unit_additional_data': {str(unit.id): ADDITIONAL}})
+    assert result['success']
+    return result['id']
+
+
+def invoice_amounts(combination_id):
+    return {i.unit_id: (i.electric_amount, i.water_amount, i.common_amount, i.additional_amount,
+                        i.carryover_amount, i.total_amount)
+            for i in bill_app.FinalInvoice.query.filter_by(combination_id=combination_id)}
+
+
+def ledger_billed():
+    return {l.unit_id: l.billed_total for l in bill_app.UnitLedger.query}
+
+
+def current_bill_ids(items):
+    """전체 재작성된 고지서는 id 가 바뀌므로 같은 종류·월·층의 현재 고지서 id 로 바꾼다"""
+    ids = []
+    for item in items:
+        if item['type'] == 'WATER':
+            ids.append(bill_app.WaterBill.query.filter_by(billing_month=item['month']).one().id)
+        else:
+            ids.append(item['id'])
+    return ids
+
+
+def test_recalculated_bill_marks_invoice_stale_and_refresh_matches_new_invoice(client):
+    floors = seed_units()
+    units = bill_app.Unit.query.order_by(bill_app.Unit.id).all()
+    items = calculate_month(client, floors, '2024-01')
+    combination_id = create_invoice(client, items, units[0])
+    before = invoice_amounts(combination_id)
+
+    # 1층 전기요금은 증분 재계산, 수도요금은 전체 재작성
+    form = {'billing_month': '2024-01', 'floor_id': floors[0].id, 'month_count': '1', 'month_0': '2024-01',
+            'amount_0': '65000', 'welfare_0': '0', 'voucher_0': '0', 'tv_fee_0': '2500', 'overwrite': 'true'}
+    for unit in floors[0].units:
+        form[f'prev_{unit.id}'] = '100'
+        form[f'curr_{unit.id}'] = str(170 + unit.id)
+    result = post(client, '/calculate/electric', form)
+    assert result['success']
+    floor_unit_ids = {u.id for u in floors[0].units}
+    assert {s['unit_id'] for s in result['stale_invoices']} == floor_unit_ids
+    assert post(client, '/calculate/water', {'billing_month': '2024-01', 'total_amount': '36000',
+                                             'overwrite': 'true', 'rebuild': 'true'})['success']
+
+    bill_app.db.session.expire_all()
+    assert bill_app.db.session.get(bill_app.InvoiceCombination, combination_id).is_stale
+    stale = {i.unit_id for i in bill_app.FinalInvoice.query.filter_by(combination_id=combination_id, is_stale=True)}
+    assert stale == {u.id for u in units}
+    assert invoice_amounts(combination_id) == before
+
+    result = post(client, f'/invoice/refresh/{combination_id}')
+    assert result['success'] and result['refreshed'] == len(units)
+    bill_app.db.session.expire_all()
+    assert not bill_app.db.session.get(bill_app.InvoiceCombination, combination_id).is_stale
+    refreshed, refreshed_ledger = invoice_amounts(combination_id), ledger_billed()
+    assert refreshed != before
+
+    # 같은 항목·추가 청구로 새로 만든 정산서와 금액이 같고, 원장도 새 정산서만큼 같은 금액이 더해진다
+    fresh_id = create_invoice(client, [dict(i, id=ref) for i, ref in zip(items, current_bill_ids(items))], units[0])
+    assert invoice_amounts(fresh_id) == refreshed
+    assert {u: billed - refreshed_ledger[u] for u, billed in ledger_billed().items()} == refreshed_ledger
+    assert client.get('/admin/validate_balances').get_json()['drift_count'] == 0
+
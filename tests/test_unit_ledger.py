@@ -0,0 +1,66 @@
+"""세대 원장: 정산서/납부 쓰기 경로마다 증분 갱신한 원장이 전체 이력 재계산과 같은지 확인"""
+import app as bill_app
+from conftest import calculate_month, post, seed_units
+
+
+def assert_no_drift(client):
+    result = client.get('/admin/validate_balances').get_json()
+    assert result['success']
+    assert result['drift_count'] == 0, [r for r in result['report'] if r['drift']]
+    return {r['unit_id']: r for r in result['report']}
+
+
+def create_invoice(client, items, units):
+    """첫 세대에는 추가 청구와 이월 항목을 붙여 billed/carryover 를 함께 확인한다"""
+    result = post(client, '/invoice/create', json={'name': 'test', 'items': items, 'unit_additional_data': {
+        str(units[0].id): {'charges': [{'description': '수선비', 'amount': 1000},
+                                       {'description': '전월 미납', 'amount': 2500}]}}})
+    assert result['success']
+    return result['id']
+
+
+def pay(client, combination_id, unit, amount, day='2024-02-05'):
+    result = post(client, '/payments/add', json={'combination_id': combination_id, 'unit_id': unit.id,
+                                                 'payment_date': day, 'payment_amount': str(amount)})
+    assert result['success']
+    return result['id']
+
+
+def test_invoice_create_and_delete_keep_ledger_in_sync(client):
+    floors = seed_units()
+    units = bill_app.Unit.query.order_by(bill_app.Unit.id).all()
+    january = create_invoice(client, calculate_month(client, floors, '2024-01'), units)
+    report = assert_no_drift(client)
+    assert report[units[0].id]['carryover_total'] == 2500 and report[units[0].id]['invoice_count'] == 1
+
+    february = create_invoice(client, calculate_month(client, floors, '2024-02'), units)
+    pay(client, february, units[1], 5000)
+    assert_no_drift(client)
+
+    assert post(client, f'/invoice/delete/{january}')['success']
+    report = assert_no_drift(client)
+    assert report[units[0].id]['invoice_count'] == 1
+
+    assert post(client, f'/invoice/delete/{february}')['success']
+    report = assert_no_drift(client)
+    assert all(r['balance'] == 0 and r['invoice_count'] == 0 for r in report.values())
+
+
+def test_payment_add_update_delete_keep_ledger_in_sync(client):
+    floors = seed_units()
+    units = bill_app.Unit.query.order_by(bill_app.Unit.id).all()
+    combination_id = create_invoice(client, calculate_month(client, floors, '2024-01'), units)
+    billed = assert_no_drift(client)[units[1].id]['total_billed']
+
+    payment_id = pay(client, combination_id, units[1], 3000)
+    pay(client, combination_id, units[1], 1500, day='2024-02-10')
+    assert assert_no_drift(client)[units[1].id]['total_paid'] == 4500
+
+    assert post(client, f'/payments/update/{payment_id}', json={
+        'payment_date': '2024-03-01', 'payment_amount': '1000'})['success']
+    report = assert_no_drift(client)
+    assert report[units[1].id]['total_paid'] == 2500
+    assert report[units[1].id]['balance'] == billed - 2500
+
+    assert post(client, f'/payments/delete/{payment_id}')['success']
+    assert assert_no_drift(client)[units[1].id]['total_paid'] == 1500
@@ -0,0 +1,76 @@
+"""버전 정보 없는 기존 DB 를 기준선(0001)으로 표시(stamp)한 뒤 이후 리비전으로 올리는 경로"""
+import json
+from datetime import date
+
+import pytest
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+
+import app as bill_app
+
+
+def test_baseline_is_the_schema_before_migrations(db):
+    baseline = bill_app.baseline_columns(bill_app.migrate.get_config())
+    assert 'building_id' not in baseline['payments'] and 'is_stale' not in baseline['final_invoices']
+    assert not {'buildings', 'unit_ledgers', 'unit_snapshots', 'web_sessions'} & set(baseline)
+    assert bill_app.legacy_schema_gaps(inspect(db.engine), baseline) == []
+
+
+def test_upgrade_schema_refuses_to_stamp_when_baseline_column_is_missing(db):
+    with db.engine.begin() as conn:
+        conn.execute(text('ALTER TABLE payments DROP COLUMN memo'))
+    with pytest.raises(RuntimeError, match=r'payments\.memo'):
+        bill_app.upgrade_schema()
+    assert not inspect(db.engine).has_table('alembic_version')
+
+
+@pytest.fixture
+def legacy_db(db):
+    """마이그레이션 도입 전 스키마(리비전 0001)에 정산서·납부·스냅샷 JSON 이 있는 DB"""
+    db.drop_all()
+    baseline = ScriptDirectory.from_config(bill_app.migrate.get_config()).get_revision('0001').module
+    snapshot = {'unit_name': '101', 'residents_count': 1, 'has_tv': True, 'electric_welfare': False,
+                'electric_voucher': False, 'water_welfare': False, 'is_vacant': False}
+    charges = [{'description': '관리비', 'amount': 1000}, {'description': '전월 미납', 'amount': 500}]
+    with db.engine.begin() as conn, Operations.context(MigrationContext.configure(conn)):
+        baseline.upgrade()
+        conn.execute(text("INSERT INTO floors (id, floor_number, name) VALUES (1, 1, '1층')"))
+        conn.execute(text("INSERT INTO units (id, floor_id, unit_name, residents_count) "
+                          "VALUES (1, 1, '101', 1), (2, 1, '102', 2)"))
+        conn.execute(text("INSERT INTO water_bills (id, billing_month, total_amount) VALUES (1, '2024-01-01', 3000)"))
+        conn.execute(text("INSERT INTO water_bill_details (water_bill_id, unit_id, base_amount, final_amount, "
+                          "charged_amount, unit_snapshot) VALUES (1, 1, 1000, 1000, 1000, :s), "
+                          "(1, 2, 2000, 2000, 2000, :s)"), {'s': json.dumps(snapshot)})
+        conn.execute(text("INSERT INTO invoice_combinations (id, invoice_name) VALUES (1, '1월')"))
+        conn.execute(text("INSERT INTO invoice_combination_items (combination_id, item_type, billing_month, "
+                          "water_bill_id) VALUES (1, 'WATER', '2024-01-01', 1)"))
+        conn.execute(text("INSERT INTO final_invoices (combination_id, unit_id, electric_amount, water_amount, "
+                          "common_amount, additional_charges, total_amount) VALUES "
+                          "(1, 1, 0, 1000, 0, :charges, 2500), (1, 2, 0, 2000, 0, NULL, 2000)"),
+                     {'charges': json.dumps(charges, ensure_ascii=False)})
+        conn.execute(text("INSERT INTO payments (combination_id, unit_id, payment_date, payment_amount) "
+                          "VALUES (1, 1, '2024-02-05', 1200)"))
+    yield db
+    with db.engine.begin() as conn:
+        conn.execute(text('DROP TABLE IF EXISTS alembic_version'))
+
+
+def test_legacy_database_is_stamped_and_backfilled_by_revisions(client, legacy_db):
+    bill_app.upgrade_schema()
+
+    script = ScriptDirectory.from_config(bill_app.migrate.get_config())
+    with legacy_db.engine.connect() as conn:
+        assert MigrationContext.configure(conn).get_current_revision() == script.get_current_head()
+
+    invoice = bill_app.FinalInvoice.query.filter_by(unit_id=1).one()
+    assert (invoice.additional_amount, invoice.carryover_amount) == (1000, 500)
+    assert {d.unit_snapshot_id for d in bill_app.WaterBillDetail.query} == {bill_app.UnitSnapshot.query.one().id}
+    assert bill_app.WaterBillDetail.query.filter(bill_app.WaterBillDetail.legacy_unit_snapshot.isnot(None)).count() == 0
+    assert {p.building_id for p in bill_app.Payment.query} == {bill_app.DEFAULT_BUILDING_ID}
+    assert bill_app.InvoiceCombination.query.one().billing_month == date(2024, 1, 1)
+
+    ledger = {l.unit_id: (l.billed_total, l.paid_total, l.balance) for l in bill_app.UnitLedger.query}
+    assert ledger == {1: (2000, 1200, 800), 2: (2000, 0, 2000)}
+    assert client.get('/admin/validate_balances').get_json()['drift_count'] == 0
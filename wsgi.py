@@ -0,0 +1,13 @@
+"""운영용 WSGI 진입점
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+    waitress-serve --listen=0.0.0.0:5000 --threads=8 wsgi:app   (Windows)
+
+워커는 기동 시 DDL 을 실행하지 않는다. 스키마 마이그레이션·기본값 등록은 배포/업그레이드 때 한 번만 실행한다.
+
+    flask --app wsgi init-db          (migrations/ 의 리비전 적용 + 기본값/백필)
+    flask --app wsgi db upgrade --sql (적용될 SQL 확인)
+"""
+from app import create_app
+
+app = create_app()